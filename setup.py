@@ -1,12 +0,0 @@
-#!/usr/bin/env python3
-"""
-Setup script for WoW Guild Analysis package.
-
-This file provides backward compatibility for older pip versions
-and development installations.
-"""
-
-from setuptools import setup
-
-if __name__ == "__main__":
-    setup()
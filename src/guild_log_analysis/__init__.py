@@ -3,18 +3,41 @@ Guild Log Analysis Package.
 
 A comprehensive tool for analyzing World of Warcraft guild logs from
 Warcraft Logs API.
+
+Public classes are resolved lazily on first attribute access so that
+importing the package (e.g. to read ``__version__``) does not pull in the
+analysis stack and its third-party dependencies.
 """
 
-__version__ = "1.0.0"
+import sys
+from types import MappingProxyType
+
+from ._lazy import lazy_exports
+from ._version import __version__  # noqa: F401
+
 __author__ = "Jonathan Sasse"
 __email__ = "jonathan.sasse@outlook.de"
 
-from .analysis.base import BossAnalysisBase
-from .analysis.bosses.one_armed_bandit import OneArmedBanditAnalysis
-from .api.client import WarcraftLogsAPIClient
+# Maps public attribute names to (relative module path, attribute name)
+_LAZY = MappingProxyType(
+    {
+        "BossAnalysisBase": (".analysis.base", "BossAnalysisBase"),
+        "OneArmedBanditAnalysis": (".analysis.bosses.one_armed_bandit", "OneArmedBanditAnalysis"),
+        "WarcraftLogsAPIClient": (".api.client", "WarcraftLogsAPIClient"),
+    }
+)
 
-__all__ = [
+__all__ = (
     "BossAnalysisBase",
     "OneArmedBanditAnalysis",
     "WarcraftLogsAPIClient",
-]
+)
+
+if sys.version_info >= (3, 15):
+    # PEP 810: the interpreter defers these imports natively until first use
+    __lazy_modules__ = [f"{__name__}{module_path}" for module_path, _ in _LAZY.values()]
+    from .analysis.base import BossAnalysisBase
+    from .analysis.bosses.one_armed_bandit import OneArmedBanditAnalysis
+    from .api.client import WarcraftLogsAPIClient
+else:
+    __getattr__, __dir__ = lazy_exports(globals(), _LAZY)
@@ -0,0 +1,43 @@
+"""
+Lazy import helpers for Guild Log Analysis.
+
+This module provides the shared machinery used to defer expensive imports
+until the exported objects are actually used.
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Any, Callable
+
+
+def lazy_exports(
+    module_globals: dict[str, Any], exports: Mapping[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build PEP 562 ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Resolved attributes are written back into the package namespace so
+    that subsequent lookups hit the module ``__dict__`` directly and never
+    reach ``__getattr__`` again. Unknown names are rejected with a single
+    set membership test, without attempting any import.
+
+    :param module_globals: The ``globals()`` of the exporting package
+    :param exports: Mapping of attribute name to (relative module path, attribute name)
+    :returns: Tuple of (``__getattr__``, ``__dir__``) functions
+    """
+    package = module_globals["__name__"]
+    valid_names = frozenset(exports)
+
+    def __getattr__(name: str) -> Any:
+        if name not in valid_names:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        module_path, attribute = exports[name]
+        value = getattr(importlib.import_module(module_path, package), attribute)
+        module_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | valid_names)
+
+    return __getattr__, __dir__
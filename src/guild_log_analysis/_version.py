@@ -0,0 +1,3 @@
+"""Version information for Guild Log Analysis."""
+
+__version__ = "2.5.0"
@@ -1,9 +1,27 @@
 """Analysis package for Guild Log Analysis."""
 
-from .base import BossAnalysisBase
-from .bosses import OneArmedBanditAnalysis
+import sys
+from types import MappingProxyType
 
-__all__ = [
+from .._lazy import lazy_exports
+
+# Maps public attribute names to (relative module path, attribute name)
+_LAZY = MappingProxyType(
+    {
+        "BossAnalysisBase": (".base", "BossAnalysisBase"),
+        "OneArmedBanditAnalysis": (".bosses.one_armed_bandit", "OneArmedBanditAnalysis"),
+    }
+)
+
+__all__ = (
     "BossAnalysisBase",
     "OneArmedBanditAnalysis",
-]
+)
+
+if sys.version_info >= (3, 15):
+    # PEP 810: the interpreter defers these imports natively until first use
+    __lazy_modules__ = [f"{__name__}{module_path}" for module_path, _ in _LAZY.values()]
+    from .base import BossAnalysisBase
+    from .bosses.one_armed_bandit import OneArmedBanditAnalysis
+else:
+    __getattr__, __dir__ = lazy_exports(globals(), _LAZY)
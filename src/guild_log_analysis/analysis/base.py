@@ -5,22 +5,70 @@ This module provides the base class for all boss-specific analyses,
 containing common functionality and abstract methods.
 """
 
+import json
 import logging
+import os
+import re
+import time
 from abc import ABC
-from collections import defaultdict
+from collections.abc import Callable, Collection, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache, partial
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+from .._version import __version__
 from ..api.client import WarcraftLogsAPIClient
-from ..config.constants import DEFAULT_WIPE_CUTOFF
-from ..plotting.base import HitCountPlot, NumberPlot, PercentagePlot, SurvivabilityPlot
+from ..config.constants import DEFAULT_WIPE_CUTOFF, REPORT_CACHE_MIN_AGE_SECONDS
+from ..config.settings import Settings
+from ..plotting.base import BaseTablePlot, HitCountPlot, NumberPlot, PercentagePlot, SurvivabilityPlot
 from ..plotting.multi_line import MultiLinePlot
+from ..plotting.styles import PlotStyleManager
+from ..utils.cache import generate_cache_key, safe_json_load, safe_json_save
 from ..utils.helpers import filter_players_by_roles
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Patterns for converting analysis names to result keys
+_NON_WORD_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def _save_plot(plot: Union[BaseTablePlot, MultiLinePlot]) -> str:
+    """
+    Render and save a plot in a worker process.
+
+    :param plot: Plot to save
+    :return: Path to the saved file
+    """
+    # Worker processes that were spawned rather than forked start with default styles
+    PlotStyleManager.setup_plot_style()
+    return plot.save()
+
+
+class _ResultsIndex(NamedTuple):
+    """Results ordered by starttime and grouped by analysis name."""
+
+    # The indexed results list and its length, to detect when the index is outdated
+    results: list[dict[str, Any]]
+    count: int
+    # Positions in results, newest report first
+    order: np.ndarray
+    # (report, analysis) tuples per analysis name, newest report first
+    by_name: dict[str, list[tuple[dict[str, Any], dict[str, Any]]]]
+    # Starttimes in ascending order, for predecessor lookups
+    ascending_starttimes: np.ndarray
+
 
 class BossAnalysisBase(ABC):
     """
@@ -43,28 +91,46 @@ class BossAnalysisBase(ABC):
         self.difficulty: int = 5  # Default to Mythic difficulty
         self.results: list[dict[str, Any]] = []
 
+        # Per-report metadata lookups, keyed by lookup name and its arguments
+        self._report_cache: dict[tuple, Any] = {}
+
+        # Reports with an analysis that failed and fell back to an empty result, which must not be persisted
+        self._failed_reports: set[str] = set()
+
+        # Report date and fight durations of the newest reports, keyed by (starttime, result count)
+        self._plot_meta_cache: dict[tuple[float, int], tuple[str, Optional[int], Optional[int]]] = {}
+
+        # Analysis configuration per CONFIG index, built on first use and shared by all reports
+        self._analysis_configs: dict[int, dict[str, Any]] = {}
+
+        # Plot configuration and pre-bound plot factory per CONFIG index, built on first use
+        self._plot_specs: dict[int, tuple[dict[str, Any], Callable[..., BaseTablePlot]]] = {}
+
+        # Results ordered by starttime and grouped by analysis name, rebuilt whenever self.results changes
+        self._results_index: Optional[_ResultsIndex] = None
+
         # Configuration attributes for registry-based system
         self.CONFIG: list[dict[str, Any]] = getattr(self, "CONFIG", [])
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _name_to_key(name: str) -> str:
         """Convert analysis name to snake_case result key."""
-        import re
-
         # Remove special characters and replace with spaces, then convert to snake_case
-        cleaned = re.sub(r"[^\w\s]", " ", name)  # Replace non-alphanumeric with spaces
-        cleaned = re.sub(r"\s+", "_", cleaned.strip())  # Replace multiple spaces with single underscore
+        cleaned = _NON_WORD_PATTERN.sub(" ", name)  # Replace non-alphanumeric with spaces
+        cleaned = _WHITESPACE_PATTERN.sub("_", cleaned.strip())  # Replace multiple spaces with single underscore
         return cleaned.lower()
 
-    def analyze(self, report_codes: list[str]) -> None:
+    def analyze(self, report_codes: list[str], invalidate: bool = False) -> None:
         """
         Analyze reports for this specific boss using configuration.
 
         :param report_codes: List of Warcraft Logs report codes to analyze
+        :param invalidate: Recompute these reports and overwrite their persisted results instead of loading them
         """
         if self.CONFIG:
             # Use unified configuration-based analysis
-            self._analyze_generic(report_codes)
+            self._analyze_generic(report_codes, invalidate=invalidate)
         else:
             # Fall back to legacy analyze method
             self._analyze_legacy(report_codes)
@@ -79,29 +145,86 @@ class BossAnalysisBase(ABC):
         """
         raise NotImplementedError("Either implement CONFIG or override _analyze_legacy")
 
-    def _analyze_generic(self, report_codes: list[str]) -> None:
+    def _analyze_generic(self, report_codes: list[str], invalidate: bool = False) -> None:
         """
         Analyze using configuration.
 
         :param report_codes: List of Warcraft Logs report codes to analyze
+        :param invalidate: Recompute the reports instead of loading their persisted results
         """
         logger.info(f"Starting {self.boss_name} analysis for {len(report_codes)} reports")
 
-        for report_code in report_codes:
+        def process_report(report_code: str) -> None:
             try:
                 logger.info(f"Processing report {report_code}")
-                self._process_report_generic(report_code)
+                self._process_report_generic(report_code, invalidate=invalidate)
             except Exception as e:
                 logger.error(f"Error processing report {report_code}: {e}")
-                continue
 
-    def _process_report_generic(self, report_code: str) -> None:
+        first_new_result = len(self.results)
+        self._map_concurrently(process_report, report_codes)
+
+        # Reports finish in arbitrary order, restore the requested order for deterministic output
+        report_order = {report_code: index for index, report_code in enumerate(report_codes)}
+        self.results[first_new_result:] = sorted(
+            self.results[first_new_result:],
+            key=lambda result: report_order.get(result.get("reportCode"), len(report_order)),
+        )
+
+    def _map_concurrently(self, func: Callable[[Any], Any], items: Iterable[Any]) -> list[Any]:
+        """
+        Apply a function to each item using a bounded thread pool.
+
+        API calls are I/O-bound, so threads overlap network latency while the
+        client's rate limiter keeps spacing out the requests themselves.
+
+        :param func: Function to apply to each item
+        :param items: Items to process
+        :return: Results in the same order as the items
+        """
+        items = list(items)
+        max_workers = min(Settings().max_concurrent_requests, len(items))
+        if max_workers <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _fight_id_list(fight_ids: Collection[int]) -> list[int]:
+        """
+        Return fight IDs as a sorted list for use as query variables.
+
+        Lists are assumed to be materialized by the caller already and are returned as is.
+
+        :param fight_ids: Fight IDs as a set or pre-sorted list
+        :return: Sorted list of fight IDs
+        """
+        if isinstance(fight_ids, list):
+            return fight_ids
+        return sorted(fight_ids)
+
+    def _process_report_generic(self, report_code: str, invalidate: bool = False) -> None:
         """
         Process a single report using configuration.
 
         :param report_code: The WarcraftLogs report code
+        :param invalidate: Recompute the report instead of loading its persisted results
         """
         logger.debug(f"Processing report {report_code} for {self.boss_name}")
+        self._failed_reports.discard(report_code)
+
+        # Reuse results persisted by a previous run with the same analysis configuration, unless this
+        # report was invalidated or a refresh of all reports was requested; fresh results then overwrite them
+        cache_path = self._report_cache_path(report_code)
+        refresh = invalidate or Settings().report_cache_refresh
+        if cache_path is not None and not refresh and cache_path.exists():
+            cached_results = safe_json_load(cache_path)
+            if cached_results is not None:
+                cached_results["fight_ids"] = set(cached_results["fight_ids"])
+                self.results.append(cached_results)
+                logger.info(f"Loaded cached results for report {report_code}")
+                return
 
         # Get fights for this report
         fight_ids = self.get_fight_ids(report_code)
@@ -127,33 +250,122 @@ class BossAnalysisBase(ABC):
         if not report_players:
             return
 
+        # Materialize the fight IDs once for every analysis query; sorting keeps the
+        # query variables, and therefore the response cache keys, deterministic
+        fight_ids_list = sorted(fight_ids)
+
+        # Fetch all table analyses and first interrupt pages for this report in a single request
+        prefetched_data = self._prefetch_table_data(report_code, fight_ids_list)
+
+        # Role-filtered player lists shared by analyses with the same roles
+        players_by_roles: dict[frozenset[str], list[dict[str, Any]]] = {}
+
         # Execute all configured analyses
-        for config in self.CONFIG:
+        for index, config in enumerate(self.CONFIG):
             try:
-                # Extract analysis config from unified CONFIG
-                analysis_config = {
-                    "name": config["name"],
-                    "result_key": self._name_to_key(config["name"]),
-                    **config["analysis"],
-                }
-                if "roles" in config:
-                    analysis_config["roles"] = config["roles"]
+                analysis_config = self._get_analysis_config(index, config)
+                if index in prefetched_data:
+                    # Copy the shared configuration only for the report specific data
+                    analysis_config = {**analysis_config, "prefetched_data": prefetched_data[index]}
 
-                data = self._execute_analysis(report_code, analysis_config, fight_ids, report_players)
+                data = self._execute_analysis(
+                    report_code, analysis_config, fight_ids_list, report_players, players_by_roles
+                )
                 report_results["analysis"].append({"name": analysis_config["name"], "data": data})
             except Exception as e:
                 logger.error(f"Error executing analysis {config['name']}: {e}")
+                self._record_failure(report_code)
                 continue
 
         self.results.append(report_results)
         logger.info(f"Successfully processed report {report_code} with {len(report_results['analysis'])} analyses")
 
+        # Only persist complete results of finished reports, so failed analyses are retried
+        # and reports that are still being logged are recomputed on the next run
+        if cache_path is not None and report_code not in self._failed_reports and self._is_report_finished(report_code):
+            safe_json_save({**report_results, "fight_ids": fight_ids_list}, cache_path)
+
+    def _record_failure(self, report_code: str) -> None:
+        """
+        Mark the results of a report as incomplete.
+
+        Analyzers log their errors and return empty results, which would otherwise look
+        like a report without data and be persisted as such.
+
+        :param report_code: The WarcraftLogs report code
+        """
+        self._failed_reports.add(report_code)
+
+    def _is_report_finished(self, report_code: str) -> bool:
+        """
+        Check whether a report is old enough that no more events will be logged to it.
+
+        :param report_code: The WarcraftLogs report code
+        :return: True if the report ended at least REPORT_CACHE_MIN_AGE_SECONDS ago
+        """
+        end_time = self._report_cache.get(("end_time", report_code))
+        return end_time is not None and time.time() - end_time >= REPORT_CACHE_MIN_AGE_SECONDS
+
+    def _get_analysis_config(self, index: int, config: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get the analysis configuration of a CONFIG entry.
+
+        It only depends on CONFIG, so it is built once and shared by all reports; handlers
+        must treat it as read-only.
+
+        :param index: Index of the entry in CONFIG
+        :param config: The CONFIG entry
+        :returns: Analysis configuration with name, result key and roles
+        """
+        analysis_config = self._analysis_configs.get(index)
+        if analysis_config is None:
+            # Extract analysis config from unified CONFIG
+            analysis_config = {
+                "name": config["name"],
+                "result_key": self._name_to_key(config["name"]),
+                **config["analysis"],
+            }
+            if "roles" in config:
+                analysis_config["roles"] = config["roles"]
+
+            self._analysis_configs[index] = analysis_config
+        return analysis_config
+
+    def _report_cache_path(self, report_code: str) -> Optional[Path]:
+        """
+        Get the file that persists analysis results for a report.
+
+        The file name includes a hash of the package version, the boss and its analysis configuration,
+        so upgrading or changing an analysis invalidates previously cached results.
+
+        :param report_code: The WarcraftLogs report code
+        :return: Path of the cache file or None if the report cache is disabled
+        """
+        settings = Settings()
+        if not settings.report_cache_enabled:
+            return None
+
+        analysis_configs = [(config["name"], config["analysis"], config.get("roles")) for config in self.CONFIG]
+        config_key = generate_cache_key(
+            __version__, type(self).__name__, self.encounter_id, self.difficulty, analysis_configs
+        )
+        return settings.cache_directory / "reports" / f"{report_code}_{config_key}.json"
+
+    # Maps analysis types to the names of their handler methods. Subclasses add custom
+    # types by extending this mapping, e.g. {**BossAnalysisBase.ANALYSIS_HANDLERS, ...}.
+    ANALYSIS_HANDLERS: dict[str, str] = {
+        "interrupts": "_handle_interrupts",
+        "damage_to_actor": "_handle_damage_to_actor",
+        "table_data": "_handle_table_data",
+    }
+
     def _execute_analysis(
         self,
         report_code: str,
         config: dict[str, Any],
-        fight_ids: set[int],
+        fight_ids: Collection[int],
         report_players: list[dict[str, Any]],
+        players_by_roles: Optional[dict[frozenset[str], list[dict[str, Any]]]] = None,
     ) -> list[dict[str, Any]]:
         """
         Execute a single analysis based on configuration.
@@ -162,46 +374,108 @@ class BossAnalysisBase(ABC):
         :param config: Analysis configuration dictionary
         :param fight_ids: Set of fight IDs to analyze
         :param report_players: List of players who participated in the fights
+        :param players_by_roles: Optional cache of filtered players per role set for this report
         :return: Analysis results data
+        :raises ValueError: If the analysis type has no handler
         """
-        # Apply role filtering if specified
-        filtered_players = self._filter_players_by_roles(report_players, config.get("roles", []))
-
         analysis_type = config["type"]
+        handler_name = self.ANALYSIS_HANDLERS.get(analysis_type)
+        if handler_name is None:
+            raise ValueError(f"Unknown analysis type: {analysis_type}")
 
-        if analysis_type == "interrupts":
-            data = self.analyze_interrupts(
-                report_code=report_code,
-                fight_ids=fight_ids,
-                report_players=filtered_players,
-                ability_id=config["ability_id"],
-                wipe_cutoff=config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
-            )
-        elif analysis_type == "damage_to_actor":
-            data = self.get_damage_to_actor(
-                report_code=report_code,
-                fight_ids=fight_ids,
-                target_game_id=config["target_game_id"],
-                report_players=filtered_players,
-                filter_expression=config.get("filter_expression"),
-                wipe_cutoff=config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
-            )
-            # Rename damage field if result_key is specified
-            if "result_key" in config and config["result_key"] != "damage":
-                for player_data in data:
-                    player_data[config["result_key"]] = player_data.pop("damage")
-        elif analysis_type == "table_data":
-            data = self.analyze_table_data(
-                report_code=report_code,
-                config=config,
-                fight_ids=fight_ids,
-                report_players=filtered_players,
-            )
+        # Apply role filtering if specified, once per distinct role set of the report
+        roles = config.get("roles", [])
+        if players_by_roles is None:
+            filtered_players = self._filter_players_by_roles(report_players, roles)
         else:
-            raise ValueError(f"Unknown analysis type: {analysis_type}")
+            roles_key = frozenset(roles)
+            filtered_players = players_by_roles.get(roles_key)
+            if filtered_players is None:
+                filtered_players = players_by_roles[roles_key] = self._filter_players_by_roles(report_players, roles)
+
+        return getattr(self, handler_name)(report_code, config, fight_ids, filtered_players)
 
+    def _handle_interrupts(
+        self,
+        report_code: str,
+        config: dict[str, Any],
+        fight_ids: Collection[int],
+        report_players: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Run an interrupts analysis.
+
+        :param report_code: The WarcraftLogs report code
+        :param config: Analysis configuration dictionary
+        :param fight_ids: Set of fight IDs to analyze
+        :param report_players: Role-filtered players who participated in the fights
+        :return: Analysis results data
+        """
+        # Reuse the first events page fetched with the batched table query
+        prefetched = {"first_page": config["prefetched_data"]} if "prefetched_data" in config else {}
+        return self.analyze_interrupts(
+            report_code=report_code,
+            fight_ids=fight_ids,
+            report_players=report_players,
+            ability_id=config["ability_id"],
+            wipe_cutoff=config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
+            **prefetched,
+        )
+
+    def _handle_damage_to_actor(
+        self,
+        report_code: str,
+        config: dict[str, Any],
+        fight_ids: Collection[int],
+        report_players: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Run a damage to actor analysis.
+
+        :param report_code: The WarcraftLogs report code
+        :param config: Analysis configuration dictionary
+        :param fight_ids: Set of fight IDs to analyze
+        :param report_players: Role-filtered players who participated in the fights
+        :return: Analysis results data
+        """
+        data = self.get_damage_to_actor(
+            report_code=report_code,
+            fight_ids=fight_ids,
+            target_game_id=config["target_game_id"],
+            report_players=report_players,
+            filter_expression=config.get("filter_expression"),
+            wipe_cutoff=config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
+        )
+        # Rename damage field if result_key is specified
+        if "result_key" in config and config["result_key"] != "damage":
+            for player_data in data:
+                player_data[config["result_key"]] = player_data.pop("damage")
         return data
 
+    def _handle_table_data(
+        self,
+        report_code: str,
+        config: dict[str, Any],
+        fight_ids: Collection[int],
+        report_players: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Run a table data analysis.
+
+        :param report_code: The WarcraftLogs report code
+        :param config: Analysis configuration dictionary
+        :param fight_ids: Set of fight IDs to analyze
+        :param report_players: Role-filtered players who participated in the fights
+        :return: Analysis results data
+        """
+        return self.analyze_table_data(
+            report_code=report_code,
+            config=config,
+            fight_ids=fight_ids,
+            report_players=report_players,
+            table_data=config.get("prefetched_data"),
+        )
+
     def _filter_players_by_roles(self, players: list[dict[str, Any]], roles: list[str]) -> list[dict[str, Any]]:
         """
         Filter players by specified roles.
@@ -212,26 +486,70 @@ class BossAnalysisBase(ABC):
         """
         return filter_players_by_roles(players, roles)
 
+    def _get_cached(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a per-report value from the instance cache, fetching it on first use.
+
+        Failed lookups (None) are not cached so that they are retried.
+
+        :param key: Cache key made of the lookup name and its arguments
+        :param fetch: Function that fetches the value
+        :return: Cached or freshly fetched value
+        """
+        if key in self._report_cache:
+            return self._report_cache[key]
+
+        value = fetch()
+        if value is not None:
+            self._report_cache[key] = value
+        return value
+
     def get_fight_ids(self, report_code: str) -> Optional[set[int]]:
         """
-        Get unique fight IDs for this boss from a report.
+        Get unique fight IDs for this boss from a report, cached per report.
+
+        :param report_code: The WarcraftLogs report code to query
+        :return: Set of fight IDs or None if not found
+        """
+        return self._get_cached(
+            ("fight_ids", report_code, self.encounter_id, self.difficulty),
+            lambda: self._fetch_fight_ids(report_code),
+        )
+
+    def _fetch_fight_ids(self, report_code: str) -> Optional[set[int]]:
+        """
+        Fetch unique fight IDs for this boss from a report.
+
+        The same query also selects the report start and end time, fight durations and
+        player details, which are stored in the per-report cache so that
+        get_start_time, get_total_fight_duration and get_participants do not
+        need their own round trips for these fights. When a damage_to_actor
+        analysis is configured, the report's actors are included as well.
 
         :param report_code: The WarcraftLogs report code to query
         :return: Set of fight IDs or None if not found
         """
         query = """
-        query GetFights(
-          $reportCode: String!, $encounterId: Int!, $difficulty: Int!
+        query GetReportMetadata(
+          $reportCode: String!, $encounterId: Int!, $difficulty: Int!, $includeActors: Boolean!
         ) {
           reportData {
             report(code: $reportCode) {
+              startTime
+              endTime
               fights(
                 encounterID: $encounterId, difficulty: $difficulty
               ) {
                 id
-                name
-                difficulty
-                encounterID
+                startTime
+                endTime
+              }
+              playerDetails(encounterID: $encounterId, difficulty: $difficulty)
+              masterData(translate: true) @include(if: $includeActors) {
+                actors {
+                  id
+                  gameID
+                }
               }
             }
           }
@@ -242,6 +560,7 @@ class BossAnalysisBase(ABC):
             "reportCode": report_code,
             "encounterId": self.encounter_id,
             "difficulty": self.difficulty,
+            "includeActors": any(config.get("analysis", {}).get("type") == "damage_to_actor" for config in self.CONFIG),
         }
 
         try:
@@ -256,7 +575,7 @@ class BossAnalysisBase(ABC):
             logger.warning(f"Report {report_code} not found")
             return None
 
-        fights = report_data.get("fights", [])
+        fights = [fight for fight in report_data.get("fights") or [] if "id" in fight]
         if not fights:
             logger.warning(
                 f"No fights found for boss {self.encounter_id} "
@@ -265,18 +584,79 @@ class BossAnalysisBase(ABC):
             return None
 
         # Extract unique fight IDs
-        fight_ids = {fight["id"] for fight in fights if "id" in fight}
-
-        if not fight_ids:
-            logger.warning(f"No valid fight IDs found in report {report_code}")
-            return None
-
+        fight_ids = {fight["id"] for fight in fights}
         logger.info(f'Found {len(fight_ids)} fights for boss "{self.boss_name}" in report {report_code}')
+
+        self._seed_report_metadata(report_code, fight_ids, fights, report_data)
         return fight_ids
 
+    def _seed_report_metadata(
+        self,
+        report_code: str,
+        fight_ids: set[int],
+        fights: list[dict[str, Any]],
+        report_data: dict[str, Any],
+    ) -> None:
+        """
+        Store metadata that came along with the fight query in the per-report cache.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs the metadata belongs to
+        :param fights: Fights with their relative start and end times
+        :param report_data: The report object of the metadata response
+        """
+        fights_key = frozenset(fight_ids)
+
+        if report_data.get("endTime") is not None:
+            self._report_cache[("end_time", report_code)] = report_data["endTime"] / 1000
+
+        if "startTime" in report_data and all("startTime" in fight and "endTime" in fight for fight in fights):
+            earliest_start_ms, total_duration_ms = self._summarize_fight_times(fights)
+            self._report_cache[("start_time", report_code, fights_key)] = (
+                report_data["startTime"] + earliest_start_ms
+            ) / 1000
+            self._report_cache[("total_duration", report_code, fights_key)] = total_duration_ms
+
+        player_details = report_data.get("playerDetails")
+        participants = self._parse_participants(player_details) if player_details else None
+        if participants:
+            self._report_cache[("participants", report_code, fights_key)] = participants
+
+        actors = (report_data.get("masterData") or {}).get("actors")
+        if actors is not None:
+            self._report_cache[("actor_ids", report_code)] = self._group_actor_ids(actors)
+
+    @staticmethod
+    def _summarize_fight_times(fights: list[dict[str, Any]]) -> tuple[int, int]:
+        """
+        Get the earliest start and the summed duration of fights in one vectorized pass.
+
+        :param fights: Non-empty list of fights with relative startTime and endTime in milliseconds
+        :return: Tuple of (earliest relative start time, total duration) in milliseconds
+        """
+        times = np.fromiter(
+            ((fight["startTime"], fight["endTime"]) for fight in fights),
+            dtype=np.dtype([("start", np.int64), ("end", np.int64)]),
+            count=len(fights),
+        )
+        return int(times["start"].min()), int((times["end"] - times["start"]).sum())
+
     def get_start_time(self, report_code: str, fight_ids: set[int]) -> Optional[float]:
         """
-        Get the start time for the fights.
+        Get the start time for the fights, cached per report and fights.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs
+        :return: Unix timestamp in seconds or None if failed
+        """
+        return self._get_cached(
+            ("start_time", report_code, frozenset(fight_ids)),
+            lambda: self._fetch_start_time(report_code, fight_ids),
+        )
+
+    def _fetch_start_time(self, report_code: str, fight_ids: set[int]) -> Optional[float]:
+        """
+        Fetch the start time for the fights.
 
         :param report_code: The WarcraftLogs report code
         :param fight_ids: Set of fight IDs
@@ -297,7 +677,7 @@ class BossAnalysisBase(ABC):
           }
         }
         """
-        variables = {"reportCode": report_code, "fightIDs": list(fight_ids)}
+        variables = {"reportCode": report_code, "fightIDs": self._fight_id_list(fight_ids)}
         result = self.api_client.make_request(query, variables)
         report_data = result["data"]["reportData"]["report"]
         if not report_data:
@@ -323,7 +703,20 @@ class BossAnalysisBase(ABC):
 
     def get_total_fight_duration(self, report_code: str, fight_ids: set[int]) -> Optional[int]:
         """
-        Get the total duration in milliseconds for specified fight IDs.
+        Get the total duration for the fights, cached per report and fights.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs to calculate total duration for
+        :return: Total duration in milliseconds or None if failed
+        """
+        return self._get_cached(
+            ("total_duration", report_code, frozenset(fight_ids)),
+            lambda: self._fetch_total_fight_duration(report_code, fight_ids),
+        )
+
+    def _fetch_total_fight_duration(self, report_code: str, fight_ids: set[int]) -> Optional[int]:
+        """
+        Fetch the total duration in milliseconds for specified fight IDs.
 
         :param report_code: The WarcraftLogs report code
         :param fight_ids: Set of fight IDs to calculate total duration for
@@ -343,7 +736,7 @@ class BossAnalysisBase(ABC):
         }
         """
 
-        variables = {"reportCode": report_code, "fightIDs": list(fight_ids)}
+        variables = {"reportCode": report_code, "fightIDs": self._fight_id_list(fight_ids)}
 
         try:
             result = self.api_client.make_request(query, variables)
@@ -359,11 +752,10 @@ class BossAnalysisBase(ABC):
                 return None
 
             # Calculate total duration by summing individual fight durations
-            total_duration_ms = 0
-            for fight in fights:
-                fight_duration = fight["endTime"] - fight["startTime"]
-                total_duration_ms += fight_duration
-                logger.debug(f"Fight {fight['id']}: {fight_duration}ms")
+            _, total_duration_ms = self._summarize_fight_times(fights)
+            if logger.isEnabledFor(logging.DEBUG):
+                for fight in fights:
+                    logger.debug(f"Fight {fight['id']}: {fight['endTime'] - fight['startTime']}ms")
 
             logger.info(f"Total duration for {len(fights)} fights: {total_duration_ms}ms")
             return total_duration_ms
@@ -374,7 +766,20 @@ class BossAnalysisBase(ABC):
 
     def get_participants(self, report_code: str, fight_ids: set[int]) -> Optional[list[dict[str, Any]]]:
         """
-        Get player details for specific fights in a report.
+        Get player details for specific fights in a report, cached per report and fights.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs to get player details for
+        :return: Player details data or None if failed
+        """
+        return self._get_cached(
+            ("participants", report_code, frozenset(fight_ids)),
+            lambda: self._fetch_participants(report_code, fight_ids),
+        )
+
+    def _fetch_participants(self, report_code: str, fight_ids: set[int]) -> Optional[list[dict[str, Any]]]:
+        """
+        Fetch player details for specific fights in a report.
 
         :param report_code: The WarcraftLogs report code
         :param fight_ids: Set of fight IDs to get player details for
@@ -390,7 +795,7 @@ class BossAnalysisBase(ABC):
         }
         """
 
-        variables = {"reportCode": report_code, "fightIds": list(fight_ids)}
+        variables = {"reportCode": report_code, "fightIds": self._fight_id_list(fight_ids)}
 
         result = self.api_client.make_request(query, variables)
 
@@ -402,45 +807,47 @@ class BossAnalysisBase(ABC):
             )
             return None
 
-        players = []
+        return self._parse_participants(player_details)
+
+    def _parse_participants(self, player_details: dict[str, Any]) -> Optional[list[dict[str, Any]]]:
+        """
+        Parse a playerDetails response into a deduplicated player list.
 
+        :param player_details: The playerDetails JSON returned by the API
+        :return: Player details data or None if no players were found
+        """
         # Process each role
-        role_mappings = [
+        role_mappings = (
             ("tanks", "tank"),
             ("healers", "healer"),
             ("dps", "dps"),
-        ]
+        )
 
         # Access the nested playerDetails data
         player_data = player_details["data"]["playerDetails"]
 
+        # Deduplicate players who might appear in multiple roles while reading them, keeping the first role
+        get_fields = itemgetter("id", "name", "type")
+        log_players = logger.isEnabledFor(logging.DEBUG)
+        unique_players: dict[str, dict[str, Any]] = {}
+        total_players = 0
         for role_key, role_name in role_mappings:
-            for player in player_data.get(role_key, []):
-                player_info = {
-                    "id": player["id"],
-                    "name": player["name"],
-                    "type": player["type"].lower(),
-                    "role": role_name,
-                }
-                players.append(player_info)
-                logger.debug(
-                    f"ID: {player_info['id']}, "
-                    f"Name: {player_info['name']}, "
-                    f"Class: {player_info['type']}, "
-                    f"Role: {player_info['role']}"
-                )
+            role_players = player_data.get(role_key, ())
+            total_players += len(role_players)
+            for player_id, name, player_type in map(get_fields, role_players):
+                if log_players:
+                    logger.debug(f"ID: {player_id}, Name: {name}, Class: {player_type.lower()}, Role: {role_name}")
+                if name not in unique_players:
+                    unique_players[name] = {
+                        "id": player_id,
+                        "name": name,
+                        "type": player_type.lower(),
+                        "role": role_name,
+                    }
 
-        logger.info(f"Found a total of {len(players)} players before deduplication.")
+        logger.info(f"Found a total of {total_players} players before deduplication.")
 
-        # Deduplicate players who might appear in multiple roles
-        seen = set()
-        deduplicated_players = []
-        for player in players:
-            if "name" in player:
-                player_name = player["name"]
-                if player_name not in seen:
-                    seen.add(player_name)
-                    deduplicated_players.append(player)
+        deduplicated_players = list(unique_players.values())
 
         logger.info(f"After deduplication: {len(deduplicated_players)} unique players.")
 
@@ -458,70 +865,115 @@ class BossAnalysisBase(ABC):
         :returns: Tuple of (current_data, previous_dict) or (None, None) if not found
         :raises ValueError: If analysis not found in data
         """
-        # Filter reports that contain the specified analysis
-        matching_reports = []
-        for report in self.results:
-            for analysis in report.get("analysis", []):
-                if analysis.get("name") == analysis_name:
-                    matching_reports.append(
-                        {
-                            "report": report,
-                            "analysis": analysis,
-                            "starttime": report.get("starttime", 0),
-                        }
-                    )
-                    break
-
+        matching_reports = self._results_by_analysis().get(analysis_name)
         if not matching_reports:
             raise ValueError(f"Analysis '{analysis_name}' is missing from data")
 
-        # Sort by starttime (latest first)
-        matching_reports.sort(key=lambda x: x["starttime"], reverse=True)
-
-        current_data = matching_reports[0]["analysis"]["data"]
+        current_data = matching_reports[0][1]["data"]
 
-        # Create previous data dictionary by looking through all reports
+        # Create previous data dictionary with the newest older value of each current player
         previous_dict = {}
         if len(matching_reports) > 1:
-            # Start from the second report (index 1) and go through all reports
-            for report_data in matching_reports[1:]:
-                previous_data = report_data["analysis"]["data"]
-                # For each player in the current data
-                for player in current_data:
-                    player_name = player[name_column]
-                    # If we haven't found a previous value for this player yet
-                    if player_name not in previous_dict:
-                        # Look for the player in this report's data
-                        matching_player = next(
-                            (p for p in previous_data if p[name_column] == player_name),
-                            None,
-                        )
-                        if matching_player and value_column in matching_player:
-                            previous_dict[player_name] = matching_player[value_column]
+            # Current players still waiting for a previous value
+            pending_names = {player[name_column] for player in current_data}
+
+            # Walk each older report's entries once, newest report first
+            for _, previous_analysis in matching_reports[1:]:
+                # Only the first entry of a player within a report counts
+                seen_names = set()
+                for entry in previous_analysis["data"]:
+                    player_name = entry[name_column]
+                    if player_name in seen_names:
+                        continue
+                    seen_names.add(player_name)
+                    if player_name in pending_names and value_column in entry:
+                        previous_dict[player_name] = entry[value_column]
+                        pending_names.discard(player_name)
+
+                # Older reports cannot contribute once every player has a previous value
+                if not pending_names:
+                    break
 
         return current_data, previous_dict
 
-    def get_damage_to_actor(
-        self,
-        report_code: str,
-        fight_ids: set[int],
-        target_game_id: int,
-        report_players: list[dict[str, Any]],
-        filter_expression: Optional[str] = None,
-        wipe_cutoff: Optional[int] = DEFAULT_WIPE_CUTOFF,
-    ) -> list[dict[str, Any]]:
+    def _results_by_analysis(self) -> dict[str, list[tuple[dict[str, Any], dict[str, Any]]]]:
         """
-        Get damage done to a specific actor (e.g., add, boss mechanic) for a single report.
+        Group analysis results by analysis name, newest report first.
+
+        :returns: Dictionary mapping analysis names to (report, analysis) tuples
+        """
+        return self._index_results().by_name
+
+    def _index_results(self) -> _ResultsIndex:
+        """
+        Order results by starttime and group them by analysis name.
+
+        The index is reused until reports are added to or replaced in self.results.
+
+        :returns: The results index of self.results
+        """
+        results_index = self._results_index
+        if (
+            results_index is not None
+            and results_index.results is self.results
+            and results_index.count == len(self.results)
+        ):
+            return results_index
+
+        starttimes = np.fromiter(
+            (report.get("starttime", 0) for report in self.results), dtype=np.float64, count=len(self.results)
+        )
+        # Stable sort on negated starttimes keeps reports with equal starttimes in insertion order
+        order = np.argsort(-starttimes, kind="stable")
+
+        index: dict[str, list[tuple[dict[str, Any], dict[str, Any]]]] = {}
+        for position in order:
+            report = self.results[position]
+            seen = set()
+            for analysis in report.get("analysis", []):
+                name = analysis.get("name")
+                # Only the first analysis of a given name counts per report
+                if name not in seen:
+                    seen.add(name)
+                    index.setdefault(name, []).append((report, analysis))
+
+        # Ascending starttimes (a reversed view of the newest-first order) for predecessor lookups
+        ascending_starttimes = starttimes[order][::-1]
+
+        self._results_index = _ResultsIndex(self.results, len(self.results), order, index, ascending_starttimes)
+        return self._results_index
+
+    def _get_previous_report(self, starttime: float) -> Optional[dict[str, Any]]:
+        """
+        Get the newest report that started before the given starttime.
+
+        :param starttime: Starttime of the report to find the predecessor of
+        :returns: The previous report, or None if no earlier report exists
+        """
+        results_index = self._index_results()
+        position = int(np.searchsorted(results_index.ascending_starttimes, starttime, side="left")) - 1
+        if position < 0:
+            return None
+        # Position counts from the oldest report, the order from the newest
+        order = results_index.order
+        return self.results[order[len(order) - 1 - position]]
+
+    def get_actor_ids_by_game_id(self, report_code: str) -> Optional[dict[int, list[int]]]:
+        """
+        Get the report's actor IDs grouped by game ID, cached per report.
 
         :param report_code: The WarcraftLogs report code
-        :param fight_ids: Set of fight IDs to analyze
-        :param target_game_id: The game ID of the target actor (e.g., 231027 for Premium Dynamite Booty)
-        :param report_players: List of players who participated in the fights
-        :param filter_expression: Optional expression to filter the report data
-        :param wipe_cutoff: Stop counting events after this many players have died
-        :return: List of player data with damage values
+        :return: Actor IDs per game ID or None if the actors could not be fetched
+        """
+        return self._get_cached(("actor_ids", report_code), lambda: self._fetch_actor_ids_by_game_id(report_code))
+
+    def _fetch_actor_ids_by_game_id(self, report_code: str) -> Optional[dict[int, list[int]]]:
+        """
+        Fetch the report's actors and group their IDs by game ID.
+
+        :param report_code: The WarcraftLogs report code
+        :return: Actor IDs per game ID or None if the actors could not be fetched
         """
-        # Step 1: Get all actors to find target IDs
         actors_query = """
         query GetActors($reportCode: String!) {
           reportData {
@@ -546,18 +998,54 @@ class BossAnalysisBase(ABC):
         try:
             if not actors_result or "data" not in actors_result or "reportData" not in actors_result["data"]:
                 logger.warning(f"No actors data returned for report {report_code}")
-                return []
+                return None
         except (TypeError, AttributeError):
             # Handle case where actors_result is a Mock object or doesn't support 'in' operator
             logger.warning(f"Invalid actors data returned for report {report_code}")
-            return []
+            return None
 
-        # Find all target IDs matching the game ID
         actors = actors_result["data"]["reportData"]["report"]["masterData"]["actors"]
-        target_ids = []
+        return self._group_actor_ids(actors)
+
+    @staticmethod
+    def _group_actor_ids(actors: list[dict[str, Any]]) -> dict[int, list[int]]:
+        """
+        Group actor IDs by game ID.
+
+        :param actors: Actors from the report's masterData
+        :return: Actor IDs per game ID
+        """
+        actor_ids_by_game_id: dict[int, list[int]] = {}
         for actor in actors:
-            if actor.get("gameID") == target_game_id:
-                target_ids.append(actor["id"])
+            actor_ids_by_game_id.setdefault(actor.get("gameID"), []).append(actor["id"])
+        return actor_ids_by_game_id
+
+    def get_damage_to_actor(
+        self,
+        report_code: str,
+        fight_ids: Collection[int],
+        target_game_id: int,
+        report_players: list[dict[str, Any]],
+        filter_expression: Optional[str] = None,
+        wipe_cutoff: Optional[int] = DEFAULT_WIPE_CUTOFF,
+    ) -> list[dict[str, Any]]:
+        """
+        Get damage done to a specific actor (e.g., add, boss mechanic) for a single report.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs to analyze
+        :param target_game_id: The game ID of the target actor (e.g., 231027 for Premium Dynamite Booty)
+        :param report_players: List of players who participated in the fights
+        :param filter_expression: Optional expression to filter the report data
+        :param wipe_cutoff: Stop counting events after this many players have died
+        :return: List of player data with damage values
+        """
+        # Step 1: Find all target IDs matching the game ID in the report's actors
+        actor_ids_by_game_id = self.get_actor_ids_by_game_id(report_code)
+        if actor_ids_by_game_id is None:
+            self._record_failure(report_code)
+            return []
+        target_ids = actor_ids_by_game_id.get(target_game_id, [])
 
         if not target_ids:
             logger.warning(f"No targets found with game ID {target_game_id} in report {report_code}")
@@ -589,94 +1077,241 @@ class BossAnalysisBase(ABC):
         }
         """
 
-        # Initialize damage tracking for each player
-        damage_totals = defaultdict(int)
+        # Slot per player name for constant-time entry matching and array aggregation
+        player_slots, _ = self._index_players(report_players)
+
+        # Matched entries of all targets, summed per slot in one step afterwards
+        entry_slots: list[int] = []
+        entry_totals: list[int] = []
+
+        # Variables shared by all target queries, built once instead of per target
+        base_variables = {
+            "reportCode": report_code,
+            "fightIDs": self._fight_id_list(fight_ids),
+            "filterExpression": filter_expression,
+            "encounterID": self.encounter_id,
+            "difficulty": self.difficulty,
+            "wipeCutoff": wipe_cutoff,
+        }
+
+        def fetch_target_damage(target_id: int) -> dict[str, Any]:
+            return self.api_client.make_request(damage_query, {**base_variables, "targetID": target_id})
+
+        # Query damage for all target IDs concurrently, then aggregate in target order
+        damage_results = self._map_concurrently(fetch_target_damage, target_ids)
+
+        for target_id, damage_result in zip(target_ids, damage_results):
+            if not damage_result or "data" not in damage_result or "reportData" not in damage_result["data"]:
+                logger.warning(f"No damage data returned for target {target_id}")
+                self._record_failure(report_code)
+                continue
+
+            table_data = damage_result["data"]["reportData"]["report"]["table"]
+            if not table_data or "data" not in table_data:
+                logger.warning(f"No table data found for target {target_id}")
+                continue
+
+            if len(table_data["data"]["entries"]) == 0:
+                logger.warning(f"No entries found for target {target_id}")
+                continue
+
+            # Process damage entries for this target
+            entries = table_data["data"].get("entries", [])
+            for entry in entries:
+                player_name = entry.get("name")
+                total_damage = entry.get("total", 0)
+
+                # Find matching player in report_players
+                slot = player_slots.get(player_name)
+                if slot is not None:
+                    entry_slots.append(slot)
+                    entry_totals.append(total_damage)
+                elif logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Player {player_name} is missing in report_players")
+
+        damage = np.zeros(len(player_slots), dtype=np.asarray(entry_totals or [0]).dtype)
+        np.add.at(damage, np.asarray(entry_slots, dtype=np.intp), np.asarray(entry_totals, dtype=damage.dtype))
+        damage_totals = dict(zip(player_slots, damage.tolist()))
+
+        return self._build_player_rows(report_players, "damage", damage_totals)
+
+    def analyze_interrupts(
+        self,
+        report_code: str,
+        fight_ids: Collection[int],
+        report_players: list[dict[str, Any]],
+        ability_id: float,
+        wipe_cutoff: Optional[int] = DEFAULT_WIPE_CUTOFF,
+        first_page: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Analyze interrupt events for a specific ability.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs to analyze
+        :param report_players: List of players who participated in the fights
+        :param ability_id: The ability ID to track interrupts for
+        :param wipe_cutoff: Stop counting events after this many players have died
+        :param first_page: Optional prefetched first events page (data and nextPageTimestamp)
+        :return: List of player data with interrupt counts
+        """
+        # Materialize the fight IDs once for every page request
+        fight_ids = self._fight_id_list(fight_ids)
+        if first_page is not None:
+            events, next_timestamp = list(first_page["data"] or []), first_page.get("nextPageTimestamp")
+        else:
+            events, next_timestamp = self._fetch_interrupt_page(report_code, fight_ids, ability_id, wipe_cutoff)
+
+        if next_timestamp is not None:
+            # Follow nextPageTimestamp for all fights at once; requests share one global rate limit,
+            # so splitting the remaining pages per fight would only add rate-limited requests
+            events.extend(self._fetch_interrupt_events(report_code, fight_ids, ability_id, wipe_cutoff, next_timestamp))
+
+        interrupt_counts = self._count_events_by_player(events, "sourceID", report_players)
+
+        return self._build_player_rows(report_players, "interrupts", interrupt_counts)
+
+    @staticmethod
+    def _index_players(report_players: list[dict[str, Any]]) -> tuple[dict[str, int], dict[int, int]]:
+        """
+        Index players by name and actor ID in a single pass.
+
+        Each distinct player name gets a dense slot number for array aggregation; all actor
+        IDs of a name (role switching) map to the same slot.
+
+        :param report_players: List of players who participated in the fights
+        :return: Tuple of (slot per player name, slot per actor ID)
+        """
+        player_slots: dict[str, int] = {}
+        slot_by_id: dict[int, int] = {}
         for player in report_players:
-            damage_totals[player["name"]] = 0
-
-        # Query damage for each target ID and aggregate
-        for target_id in target_ids:
-            damage_variables = {
-                "reportCode": report_code,
-                "fightIDs": list(fight_ids),
-                "targetID": target_id,
-                "filterExpression": filter_expression,
-                "encounterID": self.encounter_id,
-                "difficulty": self.difficulty,
-                "wipeCutoff": wipe_cutoff,
-            }
+            slot_by_id[player["id"]] = player_slots.setdefault(player["name"], len(player_slots))
+        return player_slots, slot_by_id
 
-            damage_result = self.api_client.make_request(damage_query, damage_variables)
-            if not damage_result or "data" not in damage_result or "reportData" not in damage_result["data"]:
-                logger.warning(f"No damage data returned for target {target_id}")
-                continue
+    @staticmethod
+    def _count_events_by_player(
+        events: list[dict[str, Any]], id_key: str, report_players: list[dict[str, Any]]
+    ) -> dict[str, int]:
+        """
+        Count events per player name by matching actor IDs with NumPy.
 
-            table_data = damage_result["data"]["reportData"]["report"]["table"]
-            if not table_data or "data" not in table_data:
-                logger.warning(f"No table data found for target {target_id}")
-                continue
+        The IDs of all events are matched against the sorted player IDs with a
+        single searchsorted call and counted with bincount, so the per-event
+        work happens in compiled code rather than a Python loop.
 
-            if len(table_data["data"]["entries"]) == 0:
-                logger.warning(f"No entries found for target {target_id}")
-                continue
+        :param events: Events to count
+        :param id_key: Event key holding the actor ID (e.g. "sourceID")
+        :param report_players: List of players who participated in the fights
+        :return: Event count per player name (players without events have 0)
+        """
+        player_slots, slot_by_id = BossAnalysisBase._index_players(report_players)
+        if not slot_by_id:
+            return {}
 
-            # Process damage entries for this target
-            entries = table_data["data"].get("entries", [])
-            for entry in entries:
-                player_name = entry.get("name")
-                total_damage = entry.get("total", 0)
+        # Sorted player IDs with their slots for binary search
+        player_ids = np.fromiter(slot_by_id.keys(), dtype=np.int64, count=len(slot_by_id))
+        id_order = np.argsort(player_ids)
+        player_ids = player_ids[id_order]
+        id_slots = np.fromiter(slot_by_id.values(), dtype=np.intp, count=len(slot_by_id))[id_order]
+
+        # Events without an actor ID get -1, which never matches a player; each ID is looked up once
+        event_ids = np.fromiter(
+            (-1 if (actor_id := event.get(id_key)) is None else actor_id for event in events),
+            dtype=np.int64,
+            count=len(events),
+        )
+        positions = np.minimum(np.searchsorted(player_ids, event_ids), len(player_ids) - 1)
+        matched = player_ids[positions] == event_ids
 
-                # Find matching player in report_players
-                matching_player = next(
-                    (player for player in report_players if player["name"] == player_name),
-                    None,
-                )
-                if matching_player:
-                    damage_totals[player_name] += total_damage
-                else:
-                    logger.debug(f"Player {player_name} is missing in report_players")
+        if logger.isEnabledFor(logging.DEBUG):
+            for source_id in np.unique(event_ids[~matched]).tolist():
+                logger.debug(f"Source ID {source_id} is missing in report_players")
+
+        counts = np.bincount(id_slots[positions[matched]], minlength=len(player_slots))
+        return dict(zip(player_slots, counts.tolist()))
+
+    @staticmethod
+    def _build_player_rows(
+        report_players: list[dict[str, Any]], value_key: str, values_by_name: dict[str, int]
+    ) -> list[dict[str, Any]]:
+        """
+        Build one result row per player name in a single pass.
 
-        # Create a dictionary to store unique player data
-        unique_players = {}
+        Values are keyed by name, so duplicate entries of a player (role switching)
+        would carry the same value; the first entry decides class and role.
+
+        :param report_players: List of players who participated in the fights
+        :param value_key: Result key for the player's value (e.g. "interrupts")
+        :param values_by_name: Values per player name, missing players get 0
+        :return: List of player data for DataFrame creation
+        """
+        player_rows = []
+        seen_names = set()
         for player in report_players:
             player_name = player["name"]
-            if player_name not in unique_players:
-                unique_players[player_name] = {
+            if player_name in seen_names:
+                continue
+            seen_names.add(player_name)
+            player_rows.append(
+                {
                     "player_name": player_name,
                     "class": player["type"],
                     "role": player["role"],
-                    "damage": damage_totals[player_name],
+                    value_key: values_by_name.get(player_name, 0),
                 }
-            else:
-                # If player exists, update damage if the new total is higher
-                if damage_totals[player_name] > unique_players[player_name]["damage"]:
-                    unique_players[player_name]["damage"] = damage_totals[player_name]
-
-        # Convert dictionary to list for DataFrame
-        return list(unique_players.values())
+            )
+        return player_rows
 
-    def analyze_interrupts(
+    def _fetch_interrupt_events(
         self,
         report_code: str,
-        fight_ids: set[int],
-        report_players: list[dict[str, Any]],
+        fight_ids: Collection[int],
         ability_id: float,
-        wipe_cutoff: Optional[int] = DEFAULT_WIPE_CUTOFF,
+        wipe_cutoff: Optional[int],
+        start_time: Optional[float] = None,
     ) -> list[dict[str, Any]]:
         """
-        Analyze interrupt events for a specific ability.
+        Fetch all interrupt event pages from a start timestamp onwards.
 
         :param report_code: The WarcraftLogs report code
-        :param fight_ids: Set of fight IDs to analyze
-        :param report_players: List of players who participated in the fights
+        :param fight_ids: Set of fight IDs to fetch events for
         :param ability_id: The ability ID to track interrupts for
         :param wipe_cutoff: Stop counting events after this many players have died
-        :return: List of player data with interrupt counts
+        :param start_time: Timestamp of the first page, None to start at the beginning
+        :return: List of interrupt events
         """
         events = []
-        next_timestamp = None
+        next_timestamp = start_time
+
+        # Keep fetching until no more pages
+        while True:
+            page_events, next_timestamp = self._fetch_interrupt_page(
+                report_code, fight_ids, ability_id, wipe_cutoff, next_timestamp
+            )
+            events.extend(page_events)
+            if next_timestamp is None:
+                break  # No more pages
+
+        return events
 
-        # Get interrupt events
+    def _fetch_interrupt_page(
+        self,
+        report_code: str,
+        fight_ids: Collection[int],
+        ability_id: float,
+        wipe_cutoff: Optional[int],
+        start_time: Optional[float] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[float]]:
+        """
+        Fetch a single page of interrupt events.
+
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs to fetch events for
+        :param ability_id: The ability ID to track interrupts for
+        :param wipe_cutoff: Stop counting events after this many players have died
+        :param start_time: Timestamp of the page, None for the first page
+        :return: Tuple of (events on this page, timestamp of the next page or None)
+        """
         query = """
         query GetInterrupts(
             $reportCode: String!, $fightIds: [Int!]!, $abilityId: Float!,
@@ -700,75 +1335,38 @@ class BossAnalysisBase(ABC):
         }
         """
 
-        # Keep fetching until no more pages
-        while True:
-            variables = {
-                "reportCode": report_code,
-                "fightIds": list(fight_ids),
-                "abilityId": float(ability_id),
-                "startTime": next_timestamp,  # None for first page, timestamp for subsequent pages
-                "wipeCutoff": wipe_cutoff,
-            }
-
-            result = self.api_client.make_request(query, variables)
-            if not result or "data" not in result or "reportData" not in result["data"]:
-                break
-
-            report_data = result["data"]["reportData"]["report"]
-            events_data = report_data["events"]
-
-            # Add events from this page to our collection
-            if events_data["data"]:
-                events.extend(events_data["data"])
-
-            # Check if there are more pages
-            next_timestamp = events_data.get("nextPageTimestamp")
-            if next_timestamp is None:
-                break  # No more pages
-
-        # Initialize interrupt counter for each player
-        interrupt_counts = defaultdict(int)
-        for player in report_players:
-            interrupt_counts[player["name"]] = 0
-
-        # Count interrupts
-        for event in events:
-            source_id = event.get("sourceID")
-            matching_player = next(
-                (player for player in report_players if player["id"] == source_id),
-                None,
-            )
+        variables = {
+            "reportCode": report_code,
+            "fightIds": self._fight_id_list(fight_ids),
+            "abilityId": float(ability_id),
+            "startTime": start_time,
+            "wipeCutoff": wipe_cutoff,
+        }
 
-            if matching_player:
-                interrupt_counts[matching_player["name"]] += 1
-            else:
-                logger.debug(f"Source ID {source_id} is missing in report_players")
+        result = self.api_client.make_request(query, variables)
+        if not result or "data" not in result or "reportData" not in result["data"]:
+            # Missing events would otherwise be persisted as a report without interrupts
+            self._record_failure(report_code)
+            return [], None
 
-        # Create a dictionary to store unique player data
-        unique_players = {}
-        for player in report_players:
-            player_name = player["name"]
-            if player_name not in unique_players:
-                unique_players[player_name] = {
-                    "player_name": player_name,
-                    "class": player["type"],
-                    "role": player["role"],  # Keep the first role encountered
-                    "interrupts": interrupt_counts[player_name],
-                }
-            else:
-                # If player exists, update interrupts if the new count is higher
-                if interrupt_counts[player_name] > unique_players[player_name]["interrupts"]:
-                    unique_players[player_name]["interrupts"] = interrupt_counts[player_name]
+        events_data = result["data"]["reportData"]["report"]["events"]
+        return events_data["data"] or [], events_data.get("nextPageTimestamp")
 
-        # Convert dictionary to list for DataFrame
-        return list(unique_players.values())
+    # Metrics reported for players without an entry in the table, per table data type
+    TABLE_DATA_DEFAULT_METRICS: dict[str, dict[str, Any]] = {
+        "Debuffs": {"uptime_percentage": 0.0, "hit_count": 0},
+        "DamageTaken": {"damage_taken": 0, "total_reduced": 0, "overheal": 0, "hit_count": 0},
+        "Deaths": {"deaths": 0, "hit_count": 0},
+        "Survivability": {"survivability_percentage": 0.0, "hit_count": 0},
+    }
 
     def analyze_table_data(
         self,
         report_code: str,
         config: dict[str, Any],
-        fight_ids: Optional[set[int]] = None,
+        fight_ids: Optional[Collection[int]] = None,
         report_players: Optional[list[dict[str, Any]]] = None,
+        table_data: Optional[Any] = None,
     ) -> list[dict[str, Any]]:
         """
         Analyze data using the table query for flexible data retrieval.
@@ -777,19 +1375,20 @@ class BossAnalysisBase(ABC):
         :param config: Configuration dictionary containing table query parameters
         :param fight_ids: Optional set of fight IDs to filter
         :param report_players: List of players who participated in the fights
+        :param table_data: Already fetched table data, skips the table query if given
         :return: List of player data processed from table response
         """
-        # Get table data using the new method
-        table_data = self.get_table_data(
-            report_code=report_code,
-            encounter_id=config.get("encounter_id", self.encounter_id),
-            difficulty=config.get("difficulty", self.difficulty),
-            ability_id=config["ability_id"],
-            data_type=config.get("data_type", "Debuffs"),
-            kill_type=config.get("kill_type", "Wipes"),
-            fight_ids=fight_ids,
-            wipe_cutoff=config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
-        )
+        if table_data is None:
+            table_data = self.get_table_data(
+                report_code=report_code,
+                encounter_id=config.get("encounter_id", self.encounter_id),
+                difficulty=config.get("difficulty", self.difficulty),
+                ability_id=config["ability_id"],
+                data_type=config.get("data_type", "Debuffs"),
+                kill_type=config.get("kill_type", "Wipes"),
+                fight_ids=fight_ids,
+                wipe_cutoff=config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
+            )
 
         if not table_data:
             logger.warning(f"No table data returned for report {report_code}")
@@ -801,11 +1400,9 @@ class BossAnalysisBase(ABC):
 
         # Parse the table data to extract metrics by player name
         try:
-            # Table data is typically JSON with player entries
-            import json
-
+            # The API client already decodes responses, so only raw JSON strings need parsing here
             if isinstance(table_data, str):
-                parsed_data = json.loads(table_data)
+                parsed_data = orjson.loads(table_data) if orjson is not None else json.loads(table_data)
             else:
                 parsed_data = table_data
 
@@ -826,18 +1423,32 @@ class BossAnalysisBase(ABC):
                 else:
                     entries = parsed_data["data"]
 
-                # Process entries from table data
-                for entry in entries:
-                    if isinstance(entry, dict) and "name" in entry:
+                if config.get("data_type") == "Debuffs":
+                    total_time = parsed_data["data"].get("totalTime", 1)
+                    if total_time <= 0:
+                        # Uptime percentages are undefined without fight time
+                        logger.warning(f"Debuff table without fight time for report {report_code}")
+                        return []
+
+                    # Compute all uptime percentages in one vectorized step
+                    uptimes = np.fromiter(
+                        (entry.get("totalUptime", 0) if isinstance(entry, dict) else 0 for entry in entries),
+                        dtype=np.float64,
+                        count=len(entries),
+                    )
+                    uptime_percentages = np.round(uptimes / total_time * 100, 2).tolist()
+
+                # Process entries from table data, skipping actors that are not report participants
+                # (pets, players of other groups) since only participants end up in the result
+                player_names = {player["name"] for player in report_players}
+                for index, entry in enumerate(entries):
+                    if isinstance(entry, dict) and entry.get("name") in player_names:
                         player_name = entry["name"]
 
                         # Extract metrics based on data type
                         if config.get("data_type") == "Debuffs":
                             table_metrics[player_name] = {
-                                "uptime_percentage": round(
-                                    (entry.get("totalUptime", 0) / parsed_data["data"].get("totalTime", 1)) * 100,
-                                    2,
-                                ),
+                                "uptime_percentage": uptime_percentages[index],
                                 "hit_count": entry.get("totalUses", 0),
                             }
                         elif config.get("data_type") == "DamageTaken":
@@ -868,25 +1479,20 @@ class BossAnalysisBase(ABC):
                         elif config.get("data_type") == "Survivability":
                             # Survivability data returns fight-by-fight survivability percentages
                             # API returns decimal values (0.0-1.0), convert to percentages (0-100)
-                            fights = entry.get("fights", {})
-                            if fights:
-                                # Filter out None values and convert to float
-                                survivability_values = [float(value) for value in fights.values() if value is not None]
-                                if survivability_values:
-                                    # Convert from decimal to percentage with 2 decimal places
-                                    average_survivability = round(
-                                        (sum(survivability_values) / len(survivability_values)) * 100, 2
-                                    )
-                                else:
-                                    average_survivability = 0.0
+                            # Filter out fights without data (None) once and reuse the values for both metrics
+                            fights = entry.get("fights") or {}
+                            survivability_values = [float(value) for value in fights.values() if value is not None]
+                            if survivability_values:
+                                # Convert from decimal to percentage with 2 decimal places
+                                average_survivability = round(
+                                    (sum(survivability_values) / len(survivability_values)) * 100, 2
+                                )
                             else:
                                 average_survivability = 0.0
 
                             table_metrics[player_name] = {
                                 "survivability_percentage": average_survivability,
-                                "hit_count": len(
-                                    [v for v in fights.values() if v is not None]
-                                ),  # Number of fights with valid data
+                                "hit_count": len(survivability_values),  # Number of fights with valid data
                             }
                         else:
                             # For other data types, add all numeric fields
@@ -900,60 +1506,33 @@ class BossAnalysisBase(ABC):
                                     metrics[key] = value
                             table_metrics[player_name] = metrics
 
-            # Create result based on report_players to ensure consistency and avoid duplicates
-            unique_players = {}
+            # Create result based on report_players to ensure consistency and avoid duplicates. Metrics are
+            # keyed by name, so later entries of a player (role switching) would carry identical values.
+            default_metrics = self.TABLE_DATA_DEFAULT_METRICS.get(config.get("data_type"), {})
+            player_data = []
+            seen_names = set()
             for player in report_players:
                 player_name = player["name"]
-                if player_name not in unique_players:
-                    # Start with participant data (consistent role/class info)
-                    player_entry = {
+                if player_name in seen_names:
+                    continue
+                seen_names.add(player_name)
+                player_data.append(
+                    {
+                        # Start with participant data (consistent role/class info)
                         "player_name": player_name,
                         "class": player["type"],
                         "role": player["role"],
+                        **table_metrics.get(player_name, default_metrics),
                     }
+                )
 
-                    # Add metrics from table data if available
-                    if player_name in table_metrics:
-                        player_entry.update(table_metrics[player_name])
-                    else:
-                        # Add default values for missing players based on data type
-                        if config.get("data_type") == "Debuffs":
-                            player_entry.update({"uptime_percentage": 0.0, "hit_count": 0})
-                        elif config.get("data_type") == "DamageTaken":
-                            player_entry.update(
-                                {
-                                    "damage_taken": 0,
-                                    "total_reduced": 0,
-                                    "overheal": 0,
-                                    "hit_count": 0,
-                                }
-                            )
-                        elif config.get("data_type") == "Deaths":
-                            player_entry.update({"deaths": 0, "hit_count": 0})
-                        elif config.get("data_type") == "Survivability":
-                            player_entry.update({"survivability_percentage": 0.0, "hit_count": 0})
-
-                    unique_players[player_name] = player_entry
-                else:
-                    # Update with higher values if player appears multiple times (role switching)
-                    if player_name in table_metrics:
-                        existing_entry = unique_players[player_name]
-                        new_metrics = table_metrics[player_name]
-
-                        # Update with higher values for numeric fields
-                        for key, value in new_metrics.items():
-                            if isinstance(value, (int, float)):
-                                if key not in existing_entry or value > existing_entry[key]:
-                                    existing_entry[key] = value
-
-            # Convert to list and log results
-            player_data = list(unique_players.values())
             logger.info(f"Processed {len(player_data)} players from table data for report {report_code}")
 
             return player_data
 
         except Exception as e:
             logger.error(f"Error parsing table data for report {report_code}: {e}")
+            self._record_failure(report_code)
             return []
 
     def generate_plots(self, include_progress_plots: bool = True) -> None:
@@ -985,48 +1564,164 @@ class BossAnalysisBase(ABC):
             logger.warning("No reports available to generate plots")
             return
 
-        # Sort reports by starttime (newest first)
-        sorted_reports = sorted(self.results, key=lambda x: x["starttime"], reverse=True)
-        latest_report = sorted_reports[0]
-
-        report_date = datetime.fromtimestamp(latest_report["starttime"]).strftime("%d.%m.%Y")
-
-        # Get fight durations for current and previous reports
-        current_fight_duration = latest_report.get("total_duration")
+        report_date, current_fight_duration, previous_fight_duration = self._get_plot_metadata()
 
-        previous_fight_duration = None
-        if len(sorted_reports) > 1:
-            previous_fight_duration = sorted_reports[1].get("total_duration")
+        # Analysis data and DataFrames shared by plots of the same analysis
+        plot_data_cache: dict[tuple, Any] = {}
+        pending_plots: list[tuple[str, BaseTablePlot]] = []
 
         # Generate plots based on configuration
-        for config in self.CONFIG:
+        for index, config in enumerate(self.CONFIG):
             try:
-                # Extract plot config from unified CONFIG
-                plot_config = {
-                    "analysis_name": config["name"],
-                    "title": config["plot"].get("title", config["name"]),
-                    **{k: v for k, v in config["plot"].items() if k != "title"},
-                }
-                if "roles" in config:
-                    plot_config["roles"] = config["roles"]
+                plot_config, plot_factory = self._get_plot_spec(index, config)
 
                 self._generate_single_plot(
                     plot_config,
                     report_date,
                     current_fight_duration,
                     previous_fight_duration,
+                    data_cache=plot_data_cache,
+                    pending_plots=pending_plots,
+                    plot_factory=plot_factory,
                 )
             except Exception as e:
                 title = config.get("title") or config.get("name", "Unknown")
                 logger.error(f"Error generating plot {title}: {e}")
                 continue
 
+        self._save_plots(pending_plots)
+
+    def _get_plot_spec(self, index: int, config: dict[str, Any]) -> tuple[dict[str, Any], Callable[..., BaseTablePlot]]:
+        """
+        Get the plot configuration and plot factory of a CONFIG entry.
+
+        Both only depend on CONFIG, so they are built once and reused by later plot runs.
+
+        :param index: Index of the entry in CONFIG
+        :param config: The CONFIG entry
+        :returns: Tuple of (plot configuration, plot factory)
+        """
+        spec = self._plot_specs.get(index)
+        if spec is None:
+            # Extract plot config from unified CONFIG
+            plot_config = {
+                "analysis_name": config["name"],
+                "title": config["plot"].get("title", config["name"]),
+                **{k: v for k, v in config["plot"].items() if k != "title"},
+            }
+            if "roles" in config:
+                plot_config["roles"] = config["roles"]
+
+            spec = self._plot_specs[index] = (plot_config, self._build_plot_factory(plot_config))
+        return spec
+
+    def _build_plot_factory(self, plot_config: dict[str, Any]) -> Callable[..., BaseTablePlot]:
+        """
+        Bind the plot class and the static options of a plot configuration.
+
+        The returned factory only needs the per-run arguments: date, df, previous_data,
+        current_fight_duration and previous_fight_duration.
+
+        :param plot_config: Plot configuration dictionary
+        :returns: Plot factory
+        :raises ValueError: If the plot type is unknown
+        """
+        plot_type = plot_config["type"]
+        plot_class = self.PLOT_TYPES.get(plot_type)
+        if plot_class is None:
+            raise ValueError(f"Unknown plot type: {plot_type}")
+
+        # Column configuration with support for up to 5 columns
+        return partial(
+            plot_class,
+            title=plot_config["title"],
+            column_key_1=plot_config["column_key_1"],
+            column_header_1=plot_config.get("column_header_1", ""),
+            column_key_2=plot_config.get("column_key_2"),
+            column_header_2=plot_config.get("column_header_2", ""),
+            column_key_3=plot_config.get("column_key_3"),
+            column_header_3=plot_config.get("column_header_3", ""),
+            column_header_4=plot_config.get("column_header_4", ""),
+            column_header_5=plot_config.get("column_header_5", ""),
+            name_column=plot_config.get("name_column", "player_name"),
+            class_column=plot_config.get("class_column", "class"),
+            description=plot_config.get("description"),
+            invert_change_colors=plot_config.get("invert_change_colors", False),
+        )
+
+    def _save_plots(self, plots: list[tuple[str, Union[BaseTablePlot, MultiLinePlot]]]) -> None:
+        """
+        Render and save plots, spreading them over worker processes.
+
+        pyplot keeps global figure state and is not thread-safe, so plots are
+        rendered in separate processes rather than threads.
+
+        :param plots: Tuples of (title, plot) to save
+        """
+        # Rendering is CPU-bound, so more workers than cores only adds process overhead
+        max_workers = min(Settings().max_concurrent_plots, os.cpu_count() or 1, len(plots))
+        if max_workers <= 1:
+            for title, plot in plots:
+                try:
+                    plot.save()
+                except Exception as e:
+                    logger.error(f"Error generating plot {title}: {e}")
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_save_plot, plot): title for title, plot in plots}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error generating plot {futures[future]}: {e}")
+
+    def _get_plot_metadata(self) -> tuple[str, Optional[int], Optional[int]]:
+        """
+        Get the report date and fight durations of the two newest reports.
+
+        Repeated plot runs over the same results reuse the formatted values.
+
+        :returns: Tuple of (report_date, current_fight_duration, previous_fight_duration)
+        """
+        # Select the newest report from the starttime order shared with the analysis index
+        order = self._index_results().order
+        latest_report = self.results[order[0]]
+
+        cache_key = (latest_report["starttime"], len(self.results))
+        if cache_key in self._plot_meta_cache:
+            return self._plot_meta_cache[cache_key]
+
+        report_date = datetime.fromtimestamp(latest_report["starttime"]).strftime("%d.%m.%Y")
+
+        # Get fight durations for current and previous reports
+        current_fight_duration = latest_report.get("total_duration")
+
+        previous_report = self._get_previous_report(latest_report["starttime"])
+        previous_fight_duration = previous_report.get("total_duration") if previous_report else None
+
+        metadata = (report_date, current_fight_duration, previous_fight_duration)
+        self._plot_meta_cache[cache_key] = metadata
+        return metadata
+
+    # Maps plot types to their plot classes. Subclasses add custom types by extending this
+    # mapping, e.g. {**BossAnalysisBase.PLOT_TYPES, ...}.
+    PLOT_TYPES: dict[str, type[BaseTablePlot]] = {
+        "NumberPlot": NumberPlot,
+        "PercentagePlot": PercentagePlot,
+        "SurvivabilityPlot": SurvivabilityPlot,
+        "HitCountPlot": HitCountPlot,
+    }
+
     def _generate_single_plot(
         self,
         plot_config: dict[str, Any],
         report_date: str,
         current_fight_duration: Optional[int],
         previous_fight_duration: Optional[int],
+        data_cache: Optional[dict[tuple, Any]] = None,
+        pending_plots: Optional[list[tuple[str, BaseTablePlot]]] = None,
+        plot_factory: Optional[Callable[..., BaseTablePlot]] = None,
     ) -> None:
         """
         Generate a single plot based on configuration.
@@ -1035,41 +1730,33 @@ class BossAnalysisBase(ABC):
         :param report_date: Date string for the report
         :param current_fight_duration: Total duration of current fights in milliseconds
         :param previous_fight_duration: Total duration of previous fights in milliseconds
+        :param data_cache: Optional cache for analysis data and DataFrames shared across plots
+        :param pending_plots: Optional list that collects the plot for saving later instead of saving it now
+        :param plot_factory: Optional pre-bound plot factory, built from plot_config if not given
         """
         analysis_name = plot_config["analysis_name"]
         plot_type = plot_config["type"]
         title = plot_config["title"]
-
-        # Column configuration with support for up to 5 columns
         column_key_1 = plot_config["column_key_1"]
-        column_header_1 = plot_config.get("column_header_1", "")
-        column_key_2 = plot_config.get("column_key_2")
-        column_header_2 = plot_config.get("column_header_2", "")
-        column_key_3 = plot_config.get("column_key_3")
-        column_header_3 = plot_config.get("column_header_3", "")
-        column_header_4 = plot_config.get("column_header_4", "")
-        column_header_5 = plot_config.get("column_header_5", "")
-
         name_column = plot_config.get("name_column", "player_name")
-        class_column = plot_config.get("class_column", "class")
-        description = plot_config.get("description")
-        invert_change_colors = plot_config.get("invert_change_colors", False)
+
+        def cached(key: tuple, build: Callable[[], Any]) -> Any:
+            if data_cache is None:
+                return build()
+            if key not in data_cache:
+                data_cache[key] = build()
+            return data_cache[key]
 
         # Get analysis data
-        current_data, previous_dict = self.find_analysis_data(analysis_name, column_key_1, name_column)
+        data_key = (analysis_name, column_key_1, name_column)
+        current_data, previous_dict = cached(
+            ("data", *data_key), lambda: self.find_analysis_data(analysis_name, column_key_1, name_column)
+        )
 
         # Get the current result to access fight duration for normalization
-        current_result = None
-        if self.results:
-            # Find the result that contains the current analysis data
-            sorted_reports = sorted(self.results, key=lambda x: x["starttime"], reverse=True)
-            for report in sorted_reports:
-                for analysis in report.get("analysis", []):
-                    if analysis.get("name") == analysis_name:
-                        current_result = report
-                        break
-                if current_result:
-                    break
+        # Find the newest result that contains the current analysis data
+        matching_reports = self._results_by_analysis().get(analysis_name)
+        current_result = matching_reports[0][0] if matching_reports else None
 
         # Apply role filtering to plot data if specified
         plot_roles = plot_config.get("roles", [])
@@ -1088,7 +1775,11 @@ class BossAnalysisBase(ABC):
             logger.warning(f"No data found for analysis {analysis_name}, skipping plot generation")
             return
 
-        df = pd.DataFrame(current_data)
+        # Role-filtered data is specific to this plot, unfiltered data is shared
+        if plot_roles:
+            df = pd.DataFrame(current_data)
+        else:
+            df = cached(("frame", *data_key), lambda: pd.DataFrame(current_data))
 
         # Apply duration normalization only to previous data for change calculations
         if current_result and current_result.get("total_duration"):
@@ -1105,94 +1796,20 @@ class BossAnalysisBase(ABC):
                     logger.debug(f"Applied duration normalization to previous data for change calculations for {title}")
 
         # Create appropriate plot type
-        if plot_type == "NumberPlot":
-            plot = NumberPlot(
-                title=title,
-                date=report_date,
-                df=df,
-                previous_data=previous_dict,
-                column_key_1=column_key_1,
-                column_header_1=column_header_1,
-                column_key_2=column_key_2,
-                column_header_2=column_header_2,
-                column_key_3=column_key_3,
-                column_header_3=column_header_3,
-                column_header_4=column_header_4,
-                column_header_5=column_header_5,
-                name_column=name_column,
-                class_column=class_column,
-                current_fight_duration=current_fight_duration,
-                previous_fight_duration=previous_fight_duration,
-                description=description,
-                invert_change_colors=invert_change_colors,
-            )
-        elif plot_type == "PercentagePlot":
-            plot = PercentagePlot(
-                title=title,
-                date=report_date,
-                df=df,
-                previous_data=previous_dict,
-                column_key_1=column_key_1,
-                column_header_1=column_header_1,
-                column_key_2=column_key_2,
-                column_header_2=column_header_2,
-                column_key_3=column_key_3,
-                column_header_3=column_header_3,
-                column_header_4=column_header_4,
-                column_header_5=column_header_5,
-                name_column=name_column,
-                class_column=class_column,
-                current_fight_duration=current_fight_duration,
-                previous_fight_duration=previous_fight_duration,
-                description=description,
-                invert_change_colors=invert_change_colors,
-            )
-        elif plot_type == "SurvivabilityPlot":
-            plot = SurvivabilityPlot(
-                title=title,
-                date=report_date,
-                df=df,
-                previous_data=previous_dict,
-                column_key_1=column_key_1,
-                column_header_1=column_header_1,
-                column_key_2=column_key_2,
-                column_header_2=column_header_2,
-                column_key_3=column_key_3,
-                column_header_3=column_header_3,
-                column_header_4=column_header_4,
-                column_header_5=column_header_5,
-                name_column=name_column,
-                class_column=class_column,
-                current_fight_duration=current_fight_duration,
-                previous_fight_duration=previous_fight_duration,
-                description=description,
-                invert_change_colors=invert_change_colors,
-            )
-        elif plot_type == "HitCountPlot":
-            plot = HitCountPlot(
-                title=title,
-                date=report_date,
-                df=df,
-                previous_data=previous_dict,
-                column_key_1=column_key_1,
-                column_header_1=column_header_1,
-                column_key_2=column_key_2,
-                column_header_2=column_header_2,
-                column_key_3=column_key_3,
-                column_header_3=column_header_3,
-                column_header_4=column_header_4,
-                column_header_5=column_header_5,
-                name_column=name_column,
-                class_column=class_column,
-                current_fight_duration=current_fight_duration,
-                previous_fight_duration=previous_fight_duration,
-                description=description,
-                invert_change_colors=invert_change_colors,
-            )
+        if plot_factory is None:
+            plot_factory = self._build_plot_factory(plot_config)
+
+        plot = plot_factory(
+            date=report_date,
+            df=df,
+            previous_data=previous_dict,
+            current_fight_duration=current_fight_duration,
+            previous_fight_duration=previous_fight_duration,
+        )
+        if pending_plots is not None:
+            pending_plots.append((title, plot))
         else:
-            raise ValueError(f"Unknown plot type: {plot_type}")
-
-        plot.save()
+            plot.save()
         logger.debug(f"Generated {plot_type} for {title}")
 
     def _generate_progress_plots(self) -> None:
@@ -1203,6 +1820,9 @@ class BossAnalysisBase(ABC):
             logger.warning("No reports available to generate multi-line plots")
             return
 
+        # Progress plots are independent of each other, so they are rendered together in worker processes
+        pending_plots: list[tuple[str, MultiLinePlot]] = []
+
         # Generate multi-line plots for each configuration that has it enabled
         for config in self.CONFIG:
             multi_line_config = config.get("progress_plot")
@@ -1210,18 +1830,29 @@ class BossAnalysisBase(ABC):
                 continue
 
             try:
-                self._generate_progress_plot(config["name"], multi_line_config, config.get("roles", []))
+                self._generate_progress_plot(
+                    config["name"], multi_line_config, config.get("roles", []), pending_plots=pending_plots
+                )
             except Exception as e:
                 logger.error(f"Error generating multi-line plot for {config['name']}: {e}")
                 continue
 
-    def _generate_progress_plot(self, metric_name: str, multi_line_config: dict, roles: list = None) -> None:
+        self._save_plots(pending_plots)
+
+    def _generate_progress_plot(
+        self,
+        metric_name: str,
+        multi_line_config: dict,
+        roles: list = None,
+        pending_plots: Optional[list[tuple[str, MultiLinePlot]]] = None,
+    ) -> None:
         """
         Generate a multi-line progress plot for a specific metric.
 
         :param metric_name: Name of the metric to plot
         :param multi_line_config: Multi-line plot configuration
         :param roles: Optional role filtering for the metric
+        :param pending_plots: Optional list that collects the plots for saving later instead of saving them now
         """
         # Extract data from analysis results organized by date
         date_data = {}
@@ -1231,35 +1862,29 @@ class BossAnalysisBase(ABC):
         column_key = multi_line_config["column_key"]
         y_axis_label = multi_line_config["y_axis_label"]
 
-        for result in self.results:
+        # Reports holding this metric, oldest first so the newest report of a date wins
+        for result, analysis_item in reversed(self._results_by_analysis().get(metric_name, [])):
             # Convert timestamp to formatted date string
             timestamp = result["starttime"]
             date = datetime.fromtimestamp(timestamp).strftime("%d.%m.%Y")
 
             # Get player role information for this report
             report_code = result.get("reportCode")
-            fight_ids = set(result.get("fight_ids", []))
+            fight_ids = result.get("fight_ids")
 
             if report_code and fight_ids:
                 player_roles = self._get_player_details(report_code, fight_ids)
                 all_player_roles.update(player_roles)
                 logger.debug(f"Found {len(player_roles)} players with roles in report {report_code}")
 
-            # Find results for this specific metric
-            for analysis_item in result["analysis"]:
-                if analysis_item["name"] == metric_name:
-                    # Convert analysis data to DataFrame
-                    df = pd.DataFrame(analysis_item["data"])
+            # Apply role filtering on the records before building the DataFrame
+            player_data = analysis_item["data"]
+            if roles:
+                player_data = self._filter_players_by_roles(player_data, roles)
 
-                    # Apply role filtering if specified
-                    if roles:
-                        df = pd.DataFrame(self._filter_players_by_roles(df.to_dict("records"), roles))
-
-                    # Duration normalization is not applied to progress plots
-                    # as they display normal values, not changes
-
-                    date_data[date] = df
-                    break
+            # Duration normalization is not applied to progress plots
+            # as they display normal values, not changes
+            date_data[date] = pd.DataFrame(player_data)
 
         if not date_data:
             logger.warning(f"No data found for metric '{metric_name}'")
@@ -1275,11 +1900,14 @@ class BossAnalysisBase(ABC):
                 column_key,
                 y_axis_label,
                 role_categories,
+                pending_plots=pending_plots,
             )
         else:
             # Generate single multi-line plot
             plot_title = f"{metric_name} Progress Over Time"
-            self._create_and_save_progress_plot(plot_title, date_data, column_key, y_axis_label)
+            self._create_and_save_progress_plot(
+                plot_title, date_data, column_key, y_axis_label, pending_plots=pending_plots
+            )
 
     def _generate_role_categorized_plots(
         self,
@@ -1289,6 +1917,7 @@ class BossAnalysisBase(ABC):
         column_key: str,
         y_axis_label: str,
         role_categories: dict,
+        pending_plots: Optional[list[tuple[str, MultiLinePlot]]] = None,
     ) -> None:
         """Generate separate multi-line plots for different role categories."""
         # Group data by role categories
@@ -1299,10 +1928,12 @@ class BossAnalysisBase(ABC):
                 role_data[category][date] = pd.DataFrame()
 
             # Categorize players by role using API data
+            log_categories = logger.isEnabledFor(logging.DEBUG)
             for _, row in df.iterrows():
                 player_name = row.get("player_name", "Unknown")
                 category = self._get_player_role_category(player_name, all_player_roles)
-                logger.debug(f"Player {player_name} categorized as {category}")
+                if log_categories:
+                    logger.debug(f"Player {player_name} categorized as {category}")
 
                 # Add player to appropriate category
                 if category in role_data:
@@ -1325,19 +1956,24 @@ class BossAnalysisBase(ABC):
 
                 if filtered_data:
                     plot_title = f"{metric_name} Progress - {role_categories[category]}"
-                    self._create_and_save_progress_plot(plot_title, filtered_data, column_key, y_axis_label)
+                    self._create_and_save_progress_plot(
+                        plot_title, filtered_data, column_key, y_axis_label, pending_plots=pending_plots
+                    )
                 else:
                     logger.debug(f"No data for category {category} after filtering empty DataFrames")
             else:
                 logger.debug(f"No data for category {category}")
 
     def _create_and_save_progress_plot(
-        self, plot_title: str, date_data: dict, column_key: str, y_axis_label: str
-    ) -> str:
-        """Create and save a multi-line plot."""
+        self,
+        plot_title: str,
+        date_data: dict,
+        column_key: str,
+        y_axis_label: str,
+        pending_plots: Optional[list[tuple[str, MultiLinePlot]]] = None,
+    ) -> Optional[str]:
+        """Create and save a multi-line plot, or queue it in pending_plots for saving later."""
         # Get ignored players from settings
-        from ..config.settings import Settings
-
         settings = Settings()
         ignored_players = settings.ignored_players
 
@@ -1349,6 +1985,10 @@ class BossAnalysisBase(ABC):
             ignored_players=ignored_players,
         )
 
+        if pending_plots is not None:
+            pending_plots.append((plot_title, progress_plot))
+            return None
+
         # Save the plot
         filename = progress_plot.save()
         logger.info(f"Multi-line progress plot saved to: {filename}")
@@ -1362,7 +2002,7 @@ class BossAnalysisBase(ABC):
         ability_id: int,
         data_type: str = "Debuffs",
         kill_type: str = "Wipes",
-        fight_ids: Optional[set[int]] = None,
+        fight_ids: Optional[Collection[int]] = None,
         wipe_cutoff: Optional[int] = None,
     ) -> Optional[dict[str, Any]]:
         """
@@ -1406,7 +2046,7 @@ class BossAnalysisBase(ABC):
             "abilityID": ability_id,
             "dataType": data_type,
             "killType": kill_type,
-            "fightIDs": list(fight_ids) if fight_ids else None,
+            "fightIDs": self._fight_id_list(fight_ids) if fight_ids else None,
             "wipeCutoff": wipe_cutoff,
         }
 
@@ -1414,6 +2054,7 @@ class BossAnalysisBase(ABC):
             result = self.api_client.make_request(query, variables)
             if not result or "data" not in result:
                 logger.warning(f"No table data returned for report {report_code}")
+                self._record_failure(report_code)
                 return None
 
             table_data = result["data"]["reportData"]["report"]["table"]
@@ -1422,54 +2063,156 @@ class BossAnalysisBase(ABC):
 
         except Exception as e:
             logger.error(f"Error getting table data for report {report_code}: {e}")
+            self._record_failure(report_code)
             return None
 
-    def _get_player_details(self, report_code: str, fight_ids: set[int]) -> dict[str, str]:
+    def _prefetch_table_data(self, report_code: str, fight_ids: Collection[int]) -> dict[int, Any]:
         """
-        Get player role details from WarcraftLogs API.
+        Fetch the tables of all configured table analyses in one request.
+
+        The first events page of each interrupts analysis is included in the same request.
 
         :param report_code: The WarcraftLogs report code
-        :param fight_ids: Set of fight IDs to get player details for
-        :returns: Dictionary mapping player names to their roles
+        :param fight_ids: Set of fight IDs to filter
+        :return: Dictionary mapping CONFIG indices to their table data or first interrupt events page
         """
-        query = """
-        query GetPlayerDetails($reportCode: String!, $fightIDs: [Int]!) {
-          reportData {
-            report(code: $reportCode) {
-              playerDetails(fightIDs: $fightIDs, includeCombatantInfo: true)
-            }
-          }
-        }
+        table_configs = {}
+        interrupt_configs = {}
+        for index, config in enumerate(self.CONFIG):
+            analysis_config = config.get("analysis", {})
+            if analysis_config.get("type") == "table_data" and "ability_id" in analysis_config:
+                table_configs[index] = analysis_config
+            elif analysis_config.get("type") == "interrupts":
+                interrupt_configs[index] = analysis_config
+
+        # A single query gains nothing from batching
+        if len(table_configs) + len(interrupt_configs) < 2:
+            return {}
+
+        results = self.get_batched_table_data(
+            report_code, table_configs.values(), fight_ids, interrupt_configs=interrupt_configs.values()
+        )
+        if results is None:
+            return {}
+
+        # Missing results are left out so the analysis falls back to its own query
+        return {index: result for index, result in zip([*table_configs, *interrupt_configs], results) if result}
+
+    def get_batched_table_data(
+        self,
+        report_code: str,
+        configs: Collection[dict[str, Any]],
+        fight_ids: Optional[Collection[int]] = None,
+        interrupt_configs: Collection[dict[str, Any]] = (),
+    ) -> Optional[list[Optional[Any]]]:
+        """
+        Get several tables from WarcraftLogs API with a single aliased query.
+
+        :param report_code: The WarcraftLogs report code
+        :param configs: Table analysis configurations (ability_id, data_type, ...)
+        :param fight_ids: Optional set of fight IDs to filter
+        :param interrupt_configs: Interrupts analysis configurations whose first events page is fetched as well
+        :return: Table data per configuration followed by the first events page per interrupts configuration,
+            in the same order, or None if error
         """
+        query, variables = self._build_batched_table_query(configs, interrupt_configs)
+        variables["reportCode"] = report_code
+        variables["fightIDs"] = self._fight_id_list(fight_ids) if fight_ids else None
 
-        variables = {"reportCode": report_code, "fightIDs": list(fight_ids)}
+        try:
+            result = self.api_client.make_request(query, variables)
+            report_data = result["data"]["reportData"]["report"]
+            tables = [report_data.get(f"table{index}") for index in range(len(configs))]
+            pages = [report_data.get(f"interrupts{index}") for index in range(len(interrupt_configs))]
+        except Exception as e:
+            logger.error(f"Error getting batched table data for report {report_code}: {e}")
+            return None
 
-        result = self.api_client.make_request(query, variables)
-        if not result or "data" not in result or "reportData" not in result["data"]:
-            logger.warning(f"No player details data returned for report {report_code}")
-            return {}
+        logger.info(
+            f"Retrieved {len(tables) + len(pages)} tables and event pages in one request for report {report_code}"
+        )
+        return tables + pages
+
+    def _build_batched_table_query(
+        self, configs: Collection[dict[str, Any]], interrupt_configs: Collection[dict[str, Any]] = ()
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        Build a GraphQL query that fetches one aliased table per configuration.
+
+        :param configs: Table analysis configurations
+        :param interrupt_configs: Interrupts analysis configurations, fetched as aliased first events pages
+        :return: Tuple of (query, variables without reportCode and fightIDs)
+        """
+        declarations = ["$reportCode: String!", "$fightIDs: [Int]"]
+        fields = []
+        variables = {}
+
+        for index, config in enumerate(configs):
+            declarations.append(
+                f"$encounterID{index}: Int!, $difficulty{index}: Int!, $abilityID{index}: Float!, "
+                f"$dataType{index}: TableDataType!, $killType{index}: KillType!, $wipeCutoff{index}: Int"
+            )
+            fields.append(
+                f"table{index}: table(encounterID: $encounterID{index}, difficulty: $difficulty{index}, "
+                f"abilityID: $abilityID{index}, dataType: $dataType{index}, killType: $killType{index}, "
+                f"fightIDs: $fightIDs, wipeCutoff: $wipeCutoff{index})"
+            )
+            variables.update(
+                {
+                    f"encounterID{index}": config.get("encounter_id", self.encounter_id),
+                    f"difficulty{index}": config.get("difficulty", self.difficulty),
+                    f"abilityID{index}": config["ability_id"],
+                    f"dataType{index}": config.get("data_type", "Debuffs"),
+                    f"killType{index}": config.get("kill_type", "Wipes"),
+                    f"wipeCutoff{index}": config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF),
+                }
+            )
+
+        # Same filters as the first page of _fetch_interrupt_page
+        for index, config in enumerate(interrupt_configs):
+            declarations.append(f"$interruptAbilityID{index}: Float!, $interruptWipeCutoff{index}: Int")
+            fields.append(
+                f"interrupts{index}: events(dataType: Interrupts, fightIDs: $fightIDs, "
+                f"abilityID: $interruptAbilityID{index}, killType: Wipes, wipeCutoff: $interruptWipeCutoff{index}) "
+                "{ data nextPageTimestamp }"
+            )
+            variables[f"interruptAbilityID{index}"] = float(config["ability_id"])
+            variables[f"interruptWipeCutoff{index}"] = config.get("wipe_cutoff", DEFAULT_WIPE_CUTOFF)
+
+        field_lines = "\n".join(f"              {field}" for field in fields)
+        query = f"""
+        query GetBatchedTableData({", ".join(declarations)}) {{
+          reportData {{
+            report(code: $reportCode) {{
+{field_lines}
+            }}
+          }}
+        }}
+        """
+        return query, variables
+
+    def _get_player_details(self, report_code: str, fight_ids: Collection[int]) -> dict[str, str]:
+        """
+        Get player role details for a report.
+
+        Roles are derived from the cached participants, so progress plots reuse the
+        player details that came with the report metadata instead of querying them
+        again for every report and metric.
 
-        player_details = result["data"]["reportData"]["report"]["playerDetails"]
-        if not player_details or "data" not in player_details:
+        :param report_code: The WarcraftLogs report code
+        :param fight_ids: Set of fight IDs to get player details for
+        :returns: Dictionary mapping player names to their roles
+        """
+        participants = self.get_participants(report_code, fight_ids)
+        if not participants:
             logger.warning(f"No player details found for report {report_code}")
             return {}
 
-        # Extract role information from player details
-        player_roles = {}
-        details_data = player_details["data"]["playerDetails"]
-
-        # Process each role category
-        for role_category in ["dps", "healers", "tanks"]:
-            if role_category in details_data:
-                for player in details_data[role_category]:
-                    player_name = player.get("name")
-                    if player_name:
-                        if role_category in ["healers", "tanks"]:
-                            player_roles[player_name] = "tanks_healers"
-                        else:
-                            player_roles[player_name] = "dps"
-
-        return player_roles
+        # Tanks and healers share a category, players listed under several roles keep their first
+        return {
+            player["name"]: "tanks_healers" if player["role"] in ("tank", "healer") else "dps"
+            for player in participants
+        }
 
     def _get_player_role_category(self, player_name: str, player_roles: dict[str, str]) -> str:
         """
@@ -1480,8 +2223,6 @@ class BossAnalysisBase(ABC):
         :returns: Role category (tanks_healers, melee_dps, or ranged_dps)
         """
         # Get melee DPS players from settings
-        from ..config.settings import Settings
-
         settings = Settings()
         melee_dps_players = settings.melee_dps_players
 
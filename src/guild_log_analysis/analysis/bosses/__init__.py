@@ -1,9 +1,33 @@
-"""Boss analysis implementations package."""
+"""
+Boss analysis implementations package.
 
-from .one_armed_bandit import OneArmedBanditAnalysis
-from .sprocketmonger_lockenstock import SprocketmongerLockenstockAnalysis
+Boss modules are imported lazily so that importing one boss does not load
+its siblings. Use ``registry.discover_boss_modules()`` to import (and
+thereby register) every boss module.
+"""
 
-__all__ = [
+import sys
+from types import MappingProxyType
+
+from ..._lazy import lazy_exports
+
+# Maps public attribute names to (relative module path, attribute name)
+_LAZY = MappingProxyType(
+    {
+        "OneArmedBanditAnalysis": (".one_armed_bandit", "OneArmedBanditAnalysis"),
+        "SprocketmongerLockenstockAnalysis": (".sprocketmonger_lockenstock", "SprocketmongerLockenstockAnalysis"),
+    }
+)
+
+__all__ = (
     "OneArmedBanditAnalysis",
     "SprocketmongerLockenstockAnalysis",
-]
+)
+
+if sys.version_info >= (3, 15):
+    # PEP 810: the interpreter defers these imports natively until first use
+    __lazy_modules__ = [f"{__name__}{module_path}" for module_path, _ in _LAZY.values()]
+    from .one_armed_bandit import OneArmedBanditAnalysis
+    from .sprocketmonger_lockenstock import SprocketmongerLockenstockAnalysis
+else:
+    __getattr__, __dir__ = lazy_exports(globals(), _LAZY)
@@ -2,13 +2,71 @@
 
 import logging
 from collections import defaultdict
+from collections.abc import Collection
+from operator import itemgetter
 from typing import Any, Optional
 
+import numpy as np
+
+from ...config.constants import DEFAULT_WIPE_CUTOFF
 from ..base import BossAnalysisBase
 from ..registry import register_boss
 
+try:
+    from numba import njit
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# Fields read from each event, fetched together in one C-level call per event
+_event_fields = itemgetter("fight", "timestamp", "targetID")
+
+
+def _decode_events(events: list[dict[str, Any]], event_type: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decode events of one type into fight, timestamp and target ID arrays in a single pass.
+
+    Events of other types (e.g. absorbed or removedebuff) are dropped.
+
+    :param events: Events returned by an events query
+    :param event_type: Event type to keep (e.g. "damage" or "applydebuff")
+    :return: Tuple of (fight IDs, timestamps, target IDs) arrays
+    """
+    rows = [_event_fields(event) for event in events if event.get("type") == event_type]
+    # Timestamps are milliseconds since the report start and IDs are small, so all fields fit in int32;
+    # transposing into a copy keeps each column contiguous for sorting and searching
+    columns = np.array(rows, dtype=np.int32).reshape(-1, 3).T.copy()
+    return columns[0], columns[1], columns[2]
+
+
+def _first_hits_of_groups(group_starts: np.ndarray, timestamps: np.ndarray, window_ms: int) -> np.ndarray:
+    """
+    Flag hits that start a new hit group.
+
+    A hit starts a new group if more than ``window_ms`` passed since the last hit that
+    started a group. Counting restarts (from timestamp 0) wherever ``group_starts`` is set.
+
+    :param group_starts: Flags marking the first event of each player and fight
+    :param timestamps: Event timestamps, ascending within each player and fight
+    :param window_ms: Grouping window in milliseconds
+    :return: Flags marking the hits that are counted
+    """
+    counted = np.zeros(len(timestamps), dtype=np.bool_)
+    last_hit = 0
+    for i in range(len(timestamps)):
+        if group_starts[i]:
+            last_hit = 0
+        if timestamps[i] - last_hit > window_ms:
+            counted[i] = True
+            last_hit = timestamps[i]
+    return counted
+
+
+if njit is not None:
+    # Compiled once and cached on disk, so later processes skip the JIT step
+    _first_hits_of_groups = njit(cache=True)(_first_hits_of_groups)
+
 
 @register_boss("sprocketmonger_lockenstock")
 class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
@@ -173,48 +231,48 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
         },
     ]
 
-    def _execute_analysis(
+    ANALYSIS_HANDLERS = {
+        **BossAnalysisBase.ANALYSIS_HANDLERS,
+        "wrong_mine_analysis": "_handle_wrong_mine_analysis",
+        "polarization_blast_hits_analysis": "_handle_polarization_blast_hits_analysis",
+    }
+
+    def _handle_wrong_mine_analysis(
         self,
         report_code: str,
         config: dict[str, Any],
-        fight_ids: set[int],
+        fight_ids: Collection[int],
         report_players: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
-        """
-        Execute analysis for a single configuration item.
-
-        Overrides base implementation to handle custom analysis types.
-        """
-        analysis_type = config["type"]
-
-        if analysis_type == "wrong_mine_analysis":
-            # Apply role filtering if specified
-            filtered_players = self._filter_players_by_roles(report_players, config.get("roles", []))
-            return self.analyze_wrong_mine_triggers(
-                report_code=report_code,
-                fight_ids=fight_ids,
-                report_players=filtered_players,
-                config=config,
-                wipe_cutoff=config.get("wipe_cutoff"),
-            )
-        elif analysis_type == "polarization_blast_hits_analysis":
-            # Apply role filtering if specified
-            filtered_players = self._filter_players_by_roles(report_players, config.get("roles", []))
-            return self.analyze_polarization_blast_hits(
-                report_code=report_code,
-                fight_ids=fight_ids,
-                report_players=filtered_players,
-                config=config,
-                wipe_cutoff=config.get("wipe_cutoff"),
-            )
-        else:
-            # Delegate to parent implementation for all other types
-            return super()._execute_analysis(report_code, config, fight_ids, report_players)
+        """Run the wrong mine analysis for role-filtered players."""
+        return self.analyze_wrong_mine_triggers(
+            report_code=report_code,
+            fight_ids=fight_ids,
+            report_players=report_players,
+            config=config,
+            wipe_cutoff=config.get("wipe_cutoff"),
+        )
+
+    def _handle_polarization_blast_hits_analysis(
+        self,
+        report_code: str,
+        config: dict[str, Any],
+        fight_ids: Collection[int],
+        report_players: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Run the polarization blast hits analysis for role-filtered players."""
+        return self.analyze_polarization_blast_hits(
+            report_code=report_code,
+            fight_ids=fight_ids,
+            report_players=report_players,
+            config=config,
+            wipe_cutoff=config.get("wipe_cutoff"),
+        )
 
     def analyze_wrong_mine_triggers(
         self,
         report_code: str,
-        fight_ids: set[int],
+        fight_ids: Collection[int],
         report_players: list[dict[str, Any]],
         config: dict[str, Any],
         wipe_cutoff: Optional[int] = None,
@@ -240,20 +298,19 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
 
         # Use default wipe cutoff if not specified
         if wipe_cutoff is None:
-            from ...config.constants import DEFAULT_WIPE_CUTOFF
-
             wipe_cutoff = DEFAULT_WIPE_CUTOFF
 
-        # Query for debuff applications (applydebuff events)
-        debuff_query = """
-        query GetUnstableShrapnelEvents(
-            $reportCode: String!, $fightIDs: [Int]!, $abilityID: Float!, $wipeCutoff: Int!
+        # Query debuff applications (applydebuff events) and damage events in a single request
+        events_query = """
+        query GetWrongMineEvents(
+            $reportCode: String!, $fightIDs: [Int]!, $debuffAbilityID: Float!,
+            $damageAbilityID: Float!, $wipeCutoff: Int!
         ) {
           reportData {
             report(code: $reportCode) {
-              events(
+              debuffEvents: events(
                 fightIDs: $fightIDs,
-                abilityID: $abilityID,
+                abilityID: $debuffAbilityID,
                 dataType: Debuffs,
                 hostilityType: Friendlies,
                 wipeCutoff: $wipeCutoff,
@@ -262,21 +319,9 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
                 data
                 nextPageTimestamp
               }
-            }
-          }
-        }
-        """
-
-        # Query for damage events
-        damage_query = """
-        query GetPolarizedDamageEvents(
-            $reportCode: String!, $fightIDs: [Int]!, $abilityID: Float!, $wipeCutoff: Int!
-        ) {
-          reportData {
-            report(code: $reportCode) {
-              events(
+              damageEvents: events(
                 fightIDs: $fightIDs,
-                abilityID: $abilityID,
+                abilityID: $damageAbilityID,
                 dataType: DamageDone,
                 hostilityType: Enemies,
                 wipeCutoff: $wipeCutoff,
@@ -296,75 +341,79 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
             for player in report_players:
                 player_names[player.get("id")] = player.get("name")
 
-            # Get debuff events
-            debuff_variables = {
+            # Get debuff and damage events
+            events_variables = {
                 "reportCode": report_code,
-                "fightIDs": list(fight_ids),
-                "abilityID": float(debuff_ability_id),
+                "fightIDs": self._fight_id_list(fight_ids),
+                "debuffAbilityID": float(debuff_ability_id),
+                "damageAbilityID": float(damage_ability_id),
                 "wipeCutoff": wipe_cutoff,
             }
 
-            debuff_result = self.api_client.make_request(debuff_query, debuff_variables)
-            if not debuff_result or "data" not in debuff_result:
-                logger.warning(f"No debuff events returned for report {report_code}")
+            events_result = self.api_client.make_request(events_query, events_variables)
+            if not events_result or "data" not in events_result:
+                logger.warning(f"No debuff or damage events returned for report {report_code}")
+                self._record_failure(report_code)
                 return []
 
-            # Get damage events
-            damage_variables = {
-                "reportCode": report_code,
-                "fightIDs": list(fight_ids),
-                "abilityID": float(damage_ability_id),
-                "wipeCutoff": wipe_cutoff,
-            }
+            report_events = events_result["data"]["reportData"]["report"]
+            debuff_events = report_events["debuffEvents"]["data"]
+            application_fights, application_timestamps, culprit_ids = _decode_events(debuff_events, "applydebuff")
 
-            damage_result = self.api_client.make_request(damage_query, damage_variables)
-            if not damage_result or "data" not in damage_result:
-                logger.warning(f"No damage events returned for report {report_code}")
-                return []
+            # Without debuff applications there is nothing to correlate
+            damage_events = report_events["damageEvents"]["data"] if len(culprit_ids) else []
 
-            # Parse events
-            debuff_events = debuff_result["data"]["reportData"]["report"]["events"]["data"]
-            damage_events = damage_result["data"]["reportData"]["report"]["events"]["data"]
+            # Partition damage events by fight once so each debuff only searches its own fight
+            damage_by_fight = self._partition_damage_events(damage_events)
+            no_damage = (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32))
 
             # Track wrong mine triggers per player
             wrong_mine_triggers = defaultdict(int)
             incidents = []
 
+            # Locate the correlation windows of all debuff applications with one batched search per fight
+            window_starts = np.zeros(len(culprit_ids), dtype=np.intp)
+            window_ends = np.zeros(len(culprit_ids), dtype=np.intp)
+            for fight_id, (fight_timestamps, _) in damage_by_fight.items():
+                in_fight = application_fights == fight_id
+                window_starts[in_fight] = np.searchsorted(
+                    fight_timestamps, application_timestamps[in_fight], side="left"
+                )
+                window_ends[in_fight] = np.searchsorted(
+                    fight_timestamps, application_timestamps[in_fight] + correlation_window_ms, side="right"
+                )
+
             # Analyze each debuff application
-            for debuff_event in debuff_events:
-                if debuff_event.get("type") == "applydebuff":
-                    debuff_timestamp = debuff_event["timestamp"]
-                    culprit_id = debuff_event["targetID"]
-                    fight_id = debuff_event["fight"]
-
-                    # Find correlated damage events within the time window
-                    victims = set()
-                    for damage_event in damage_events:
-                        if (
-                            damage_event.get("type") == "damage"
-                            and damage_event["fight"] == fight_id
-                            and damage_event["timestamp"] >= debuff_timestamp
-                            and damage_event["timestamp"] <= debuff_timestamp + correlation_window_ms
-                        ):
-                            victims.add(damage_event["targetID"])
-
-                    # Check if this qualifies as a wrong mine trigger (enough victims)
-                    if len(victims) >= min_victims_threshold:
-                        wrong_mine_triggers[culprit_id] += 1
-                        incidents.append(
-                            {
-                                "culprit_id": culprit_id,
-                                "timestamp": debuff_timestamp,
-                                "fight_id": fight_id,
-                                "victim_count": len(victims),
-                                "victim_ids": list(victims),
-                            }
-                        )
+            for fight_id, debuff_timestamp, culprit_id, window_start, window_end in zip(
+                application_fights.tolist(),
+                application_timestamps.tolist(),
+                culprit_ids.tolist(),
+                window_starts.tolist(),
+                window_ends.tolist(),
+            ):
+                # Distinct targets damaged within the time window
+                _, fight_targets = damage_by_fight.get(fight_id, no_damage)
+                victims = set(fight_targets[window_start:window_end].tolist())
+
+                # Check if this qualifies as a wrong mine trigger (enough victims)
+                if len(victims) >= min_victims_threshold:
+                    wrong_mine_triggers[culprit_id] += 1
+                    incidents.append(
+                        {
+                            "culprit_id": culprit_id,
+                            "timestamp": debuff_timestamp,
+                            "fight_id": fight_id,
+                            "victim_count": len(victims),
+                            "victim_ids": list(victims),
+                        }
+                    )
 
             # Log detailed incident information
             if incidents:
                 logger.info(f"Found {len(incidents)} wrong mine triggers in report {report_code}:")
-                for incident in incidents:
+                # Per-incident lines are only formatted when they will be emitted
+                incidents_to_log = incidents if logger.isEnabledFor(logging.INFO) else []
+                for incident in incidents_to_log:
                     culprit_name = player_names.get(incident["culprit_id"], f"ID {incident['culprit_id']}")
                     victim_names = [player_names.get(vid, f"ID {vid}") for vid in incident["victim_ids"]]
                     logger.info(
@@ -409,12 +458,62 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
 
         except Exception as e:
             logger.error(f"Error analyzing wrong mine triggers for report {report_code}: {e}")
+            self._record_failure(report_code)
             return []
 
+    @staticmethod
+    def _partition_damage_events(
+        damage_events: list[dict[str, Any]],
+    ) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+        """
+        Partition damage events by fight into NumPy arrays ordered by timestamp.
+
+        Events of other types (e.g. absorbed) are dropped.
+
+        :param damage_events: Events returned by the damage events query
+        :return: Mapping of fight ID to (timestamps, target IDs) arrays
+        """
+        fights, timestamps, target_ids = _decode_events(damage_events, "damage")
+
+        # Sort by fight, then timestamp, and split at the fight boundaries
+        order = np.lexsort((timestamps, fights))
+        fights, timestamps, target_ids = fights[order], timestamps[order], target_ids[order]
+        fight_ids, boundaries = np.unique(fights, return_index=True)
+        return {
+            fight_id: (fight_timestamps, fight_targets)
+            for fight_id, fight_timestamps, fight_targets in zip(
+                fight_ids.tolist(), np.split(timestamps, boundaries[1:]), np.split(target_ids, boundaries[1:])
+            )
+        }
+
+    @staticmethod
+    def _count_grouped_hits(damage_events: list[dict[str, Any]], grouping_window_ms: int) -> dict[int, int]:
+        """
+        Count damage hits per target, merging hits within the grouping window.
+
+        Hits are grouped per target and fight; a hit counts if more than
+        ``grouping_window_ms`` passed since the last counted hit.
+
+        :param damage_events: Events returned by the damage events query
+        :param grouping_window_ms: Grouping window in milliseconds
+        :return: Counted hits per target ID
+        """
+        fights, timestamps, target_ids = _decode_events(damage_events, "damage")
+
+        # Order hits by target, fight and time so every group is one contiguous run
+        order = np.lexsort((timestamps, fights, target_ids))
+        target_ids, fights, timestamps = target_ids[order], fights[order], timestamps[order]
+        group_starts = np.ones(len(timestamps), dtype=np.bool_)
+        group_starts[1:] = (target_ids[1:] != target_ids[:-1]) | (fights[1:] != fights[:-1])
+
+        counted = _first_hits_of_groups(group_starts, timestamps, grouping_window_ms)
+        counted_targets, hit_counts = np.unique(target_ids[counted], return_counts=True)
+        return dict(zip(counted_targets.tolist(), hit_counts.tolist()))
+
     def analyze_polarization_blast_hits(
         self,
         report_code: str,
-        fight_ids: set[int],
+        fight_ids: Collection[int],
         report_players: list[dict[str, Any]],
         config: dict[str, Any],
         wipe_cutoff: Optional[int] = None,
@@ -437,8 +536,6 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
 
         # Use default wipe cutoff if not specified
         if wipe_cutoff is None:
-            from ...config.constants import DEFAULT_WIPE_CUTOFF
-
             wipe_cutoff = DEFAULT_WIPE_CUTOFF
 
         # Query for damage events
@@ -468,7 +565,7 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
             # Get damage events
             damage_variables = {
                 "reportCode": report_code,
-                "fightIDs": list(fight_ids),
+                "fightIDs": self._fight_id_list(fight_ids),
                 "abilityID": float(ability_id),
                 "wipeCutoff": wipe_cutoff,
             }
@@ -476,30 +573,13 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
             damage_result = self.api_client.make_request(damage_query, damage_variables)
             if not damage_result or "data" not in damage_result:
                 logger.warning(f"No damage events returned for report {report_code}")
+                self._record_failure(report_code)
                 return []
 
             damage_events = damage_result["data"]["reportData"]["report"]["events"]["data"]
 
             # Group hits by player and apply 10-second grouping
-            player_hit_counts = defaultdict(int)
-            player_last_hit_time = defaultdict(dict)  # player_id -> {fight_id -> last_hit_timestamp}
-
-            for event in damage_events:
-                if event.get("type") == "damage":
-                    player_id = event["targetID"]
-                    timestamp = event["timestamp"]
-                    fight_id = event["fight"]
-
-                    # Check if this is a new hit (more than 10 seconds since last hit)
-                    if player_id not in player_last_hit_time:
-                        player_last_hit_time[player_id] = {}
-
-                    last_hit_in_fight = player_last_hit_time[player_id].get(fight_id, 0)
-
-                    # Count as new hit if it's been more than grouping_window_ms since last hit
-                    if timestamp - last_hit_in_fight > grouping_window_ms:
-                        player_hit_counts[player_id] += 1
-                        player_last_hit_time[player_id][fight_id] = timestamp
+            player_hit_counts = self._count_grouped_hits(damage_events, grouping_window_ms)
 
             # Create player data structure
             player_data = []
@@ -526,4 +606,5 @@ class SprocketmongerLockenstockAnalysis(BossAnalysisBase):
 
         except Exception as e:
             logger.error(f"Error analyzing polarization blast hits for report {report_code}: {e}")
+            self._record_failure(report_code)
             return []
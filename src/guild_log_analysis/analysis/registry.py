@@ -5,7 +5,9 @@ This module provides a decorator-based system for registering boss analysis
 classes, enabling automatic discovery and method generation.
 """
 
+import importlib
 import logging
+import pkgutil
 from typing import Callable, Type
 
 logger = logging.getLogger(__name__)
@@ -45,6 +47,30 @@ def get_registered_bosses() -> dict[str, Type]:
     return _BOSS_REGISTRY.copy()
 
 
+def discover_boss_modules() -> None:
+    """
+    Import all boss analysis modules so that they register themselves.
+
+    The bosses package resolves its members lazily, so registration only
+    happens once the individual modules have been imported.
+    """
+    bosses_package = f"{__package__}.bosses"
+
+    try:
+        bosses_module = importlib.import_module(bosses_package)
+    except Exception as e:
+        logger.warning(f"Failed to import bosses package: {e}")
+        return
+
+    for _, module_name, _ in pkgutil.iter_modules(bosses_module.__path__):
+        full_module_name = f"{bosses_package}.{module_name}"
+        try:
+            importlib.import_module(full_module_name)
+            logger.debug(f"Imported boss module: {full_module_name}")
+        except Exception as e:
+            logger.warning(f"Failed to import boss module {full_module_name}: {e}")
+
+
 def clear_registry() -> None:
     """Clear the boss registry (primarily for testing purposes)."""
     _BOSS_REGISTRY.clear()
@@ -8,8 +8,9 @@ with features like rate limiting, caching, and error handling.
 import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import requests
 
@@ -17,9 +18,39 @@ from ..config import ErrorMessages
 from ..config.settings import Settings
 from .exceptions import APIError, AuthenticationError, RateLimitError
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON, using orjson when it is installed.
+
+    :param data: Encoded JSON document
+    :returns: Decoded object
+    :raises json.JSONDecodeError: If the document is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Encode an object as indented UTF-8 JSON, using orjson when it is installed.
+
+    :param obj: Object to encode
+    :returns: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 class CacheManager:
     """Manages API response caching with rotation."""
 
@@ -32,6 +63,8 @@ class CacheManager:
         settings = Settings()
         self.cache_file = cache_file or str(settings.cache_directory / "api_cache.json")
         self.cache: dict[str, Any] = self._load_cache()
+        # Guards the cache dict and file when reports are processed concurrently
+        self._lock = threading.RLock()
 
     def _get_cache_file_size(self) -> int:
         """
@@ -81,8 +114,8 @@ class CacheManager:
         """
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.cache_file, "rb") as f:
+                    return _json_loads(f.read())
             except json.JSONDecodeError:
                 logger.warning(ErrorMessages.CACHE_CORRUPTED.format(cache_file=self.cache_file))
                 return {}
@@ -99,8 +132,8 @@ class CacheManager:
             if cache_path:
                 os.makedirs(cache_path, exist_ok=True)
 
-            with open(self.cache_file, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2)
+            with open(self.cache_file, "wb") as f:
+                f.write(_json_dumps(self.cache))
         except IOError as e:
             logger.error(f"Failed to save cache: {e}")
 
@@ -125,7 +158,8 @@ class CacheManager:
         :returns: Cached response or None
         """
         cache_key = self._get_cache_key(query, variables)
-        return self.cache.get(cache_key)
+        with self._lock:
+            return self.cache.get(cache_key)
 
     def set(self, query: str, variables: Optional[dict], response: Any) -> None:
         """
@@ -136,27 +170,29 @@ class CacheManager:
         :param response: API response to cache
         """
         cache_key = self._get_cache_key(query, variables)
-        self.cache[cache_key] = response
-        self._save_cache()
+        with self._lock:
+            self.cache[cache_key] = response
+            self._save_cache()
 
     def clear(self) -> None:
         """Clear all cached data and remove all cache files."""
-        self.cache.clear()
-
-        # Remove all cache files
-        for i in range(1, 5 + 1):
-            cache_file = f"{self.cache_file}.{i}"
-            if os.path.exists(cache_file):
+        with self._lock:
+            self.cache.clear()
+
+            # Remove all cache files
+            for i in range(1, 5 + 1):
+                cache_file = f"{self.cache_file}.{i}"
+                if os.path.exists(cache_file):
+                    try:
+                        os.remove(cache_file)
+                    except OSError as e:
+                        logger.error(f"Failed to remove cache file {cache_file}: {e}")
+
+            if os.path.exists(self.cache_file):
                 try:
-                    os.remove(cache_file)
+                    os.remove(self.cache_file)
                 except OSError as e:
-                    logger.error(f"Failed to remove cache file {cache_file}: {e}")
-
-        if os.path.exists(self.cache_file):
-            try:
-                os.remove(self.cache_file)
-            except OSError as e:
-                logger.error(f"Failed to remove main cache file: {e}")
+                    logger.error(f"Failed to remove main cache file: {e}")
 
     def invalidate_entry(self, query: str, variables: Optional[dict] = None) -> None:
         """
@@ -166,9 +202,10 @@ class CacheManager:
         :param variables: Query variables
         """
         cache_key = self._get_cache_key(query, variables)
-        if cache_key in self.cache:
-            del self.cache[cache_key]
-            self._save_cache()
+        with self._lock:
+            if cache_key in self.cache:
+                del self.cache[cache_key]
+                self._save_cache()
 
 
 class RateLimiter:
@@ -182,18 +219,21 @@ class RateLimiter:
         """
         self.rate_limit_seconds = rate_limit_seconds or 1.0  # Default 1 second rate limit
         self.last_request_time = 0.0
+        # Serializes request starts across threads; responses may still overlap
+        self._lock = threading.Lock()
 
     def wait_if_needed(self) -> None:
         """Wait if necessary to respect rate limit."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        with self._lock:
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
 
-        if time_since_last_request < self.rate_limit_seconds:
-            sleep_time = self.rate_limit_seconds - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+            if time_since_last_request < self.rate_limit_seconds:
+                sleep_time = self.rate_limit_seconds - time_since_last_request
+                logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+                time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+            self.last_request_time = time.time()
 
 
 class WarcraftLogsAPIClient:
@@ -224,6 +264,14 @@ class WarcraftLogsAPIClient:
         :returns: Configured session
         """
         session = requests.Session()
+
+        # Keep enough pooled keep-alive connections for concurrent requests. Report-level and
+        # per-report fan-out (damage targets) can nest, hence the square.
+        max_concurrent_requests = Settings().max_concurrent_requests
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(10, max_concurrent_requests**2))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         session.headers.update(
             {
                 "Content-Type": "application/json",
@@ -280,7 +328,7 @@ class WarcraftLogsAPIClient:
             response = self.session.post(settings.api_url, json=payload, timeout=30)
 
             self._handle_response_errors(response)
-            result = response.json()
+            result = _json_loads(response.content)
 
             # Check for GraphQL errors
             if "errors" in result:
@@ -292,7 +340,8 @@ class WarcraftLogsAPIClient:
 
             return result
 
-        except requests.RequestException as e:
+        except (requests.RequestException, json.JSONDecodeError) as e:
+            # Invalid bodies (HTML error pages, truncated responses) fail to decode; orjson's error subclasses json's
             logger.error(f"API request failed: {e}")
             raise APIError(ErrorMessages.API_REQUEST_FAILED) from e
 
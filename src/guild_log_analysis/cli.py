@@ -5,7 +5,8 @@ import argparse
 import logging
 import sys
 
-from .analysis.registry import get_registered_bosses
+from ._version import __version__
+from .analysis.registry import discover_boss_modules, get_registered_bosses
 from .config.logging_config import setup_logging
 from .main import GuildLogAnalyzer
 
@@ -26,6 +27,7 @@ Examples:
   %(prog)s --reports kPJma1QVhABKz4Hr yC1KYmQpv9MbNw4T --boss one_armed_bandit
   %(prog)s --reports report1 report2 --boss one_armed_bandit --progress-plots
   %(prog)s --reports report1 --boss one_armed_bandit --verbose
+  %(prog)s --reports report1 --boss one_armed_bandit --invalidate-cache
   %(prog)s --list-bosses
         """,
     )
@@ -56,6 +58,14 @@ Examples:
         default=False,
     )
 
+    # Recompute persisted report results
+    parser.add_argument(
+        "--invalidate-cache",
+        action="store_true",
+        help="Recompute the given reports instead of loading their cached results",
+        default=False,
+    )
+
     # List available bosses
     parser.add_argument(
         "--list-bosses",
@@ -80,6 +90,13 @@ Examples:
         help="Enable debug logging output",
     )
 
+    # Version
+    parser.add_argument(
+        "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+
     # Output directory
     parser.add_argument(
         "--output-dir",
@@ -94,6 +111,7 @@ Examples:
 
 def list_available_bosses() -> None:
     """List all available boss encounters."""
+    discover_boss_modules()
     bosses = get_registered_bosses()
     if not bosses:
         print("No boss encounters are currently registered.")
@@ -146,6 +164,7 @@ def validate_args(args: argparse.Namespace) -> bool:
         return False
 
     # Validate boss name
+    discover_boss_modules()
     available_bosses = get_registered_bosses()
     if args.boss not in available_bosses:
         print(f"Error: Unknown boss '{args.boss}'", file=sys.stderr)
@@ -175,7 +194,7 @@ def run_analysis(args: argparse.Namespace) -> None:
 
     # Run analysis
     logger.info(f"Running analysis for {args.boss}...")
-    analyze_method(args.reports)
+    analyze_method(args.reports, invalidate=args.invalidate_cache)
     logger.info("Analysis completed successfully")
 
     # Generate plots (always enabled)
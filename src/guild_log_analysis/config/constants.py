@@ -16,6 +16,13 @@ AUTH_URL = "https://www.warcraftlogs.com/oauth/authorize"
 TOKEN_URL = "https://www.warcraftlogs.com/oauth/token"
 DEFAULT_TIMEOUT = 30
 DEFAULT_REDIRECT_URI = "http://localhost:8080"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4  # Reports processed in parallel
+DEFAULT_MAX_CONCURRENT_PLOTS = 4  # Plots rendered in parallel worker processes
+
+# Cache Configuration
+DEFAULT_REPORT_CACHE_ENABLED = False  # Reuse analysis results of already processed reports
+DEFAULT_REPORT_CACHE_REFRESH = False  # Recompute cached report results instead of loading them
+REPORT_CACHE_MIN_AGE_SECONDS = 12 * 60 * 60  # Reports that ended more recently may still be logged live
 
 # Analysis Configuration
 DEFAULT_DIFFICULTY = 5  # Mythic
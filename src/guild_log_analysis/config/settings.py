@@ -15,7 +15,11 @@ from .constants import (
     DEFAULT_LOG_FILE,
     DEFAULT_LOG_FORMAT,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_MAX_CONCURRENT_PLOTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_REDIRECT_URI,
+    DEFAULT_REPORT_CACHE_ENABLED,
+    DEFAULT_REPORT_CACHE_REFRESH,
     TOKEN_URL,
 )
 
@@ -64,6 +68,17 @@ class Settings:
         """Get OAuth redirect URI."""
         return os.getenv("REDIRECT_URI", DEFAULT_REDIRECT_URI)
 
+    # Concurrency Configuration
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Get maximum number of reports processed concurrently."""
+        return max(1, int(os.getenv("MAX_CONCURRENT_REQUESTS", DEFAULT_MAX_CONCURRENT_REQUESTS)))
+
+    @property
+    def max_concurrent_plots(self) -> int:
+        """Get maximum number of plots rendered concurrently."""
+        return max(1, int(os.getenv("MAX_CONCURRENT_PLOTS", DEFAULT_MAX_CONCURRENT_PLOTS)))
+
     # Cache Configuration
     @property
     def cache_directory(self) -> Path:
@@ -71,6 +86,18 @@ class Settings:
         cache_dir = os.getenv("CACHE_DIRECTORY", "cache")
         return Path(cache_dir)
 
+    @property
+    def report_cache_enabled(self) -> bool:
+        """Get whether analysis results are cached per report."""
+        value = os.getenv("REPORT_CACHE_ENABLED", str(DEFAULT_REPORT_CACHE_ENABLED))
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
+    @property
+    def report_cache_refresh(self) -> bool:
+        """Get whether cached report results are recomputed and overwritten instead of loaded."""
+        value = os.getenv("REPORT_CACHE_REFRESH", str(DEFAULT_REPORT_CACHE_REFRESH))
+        return value.strip().lower() in ("1", "true", "yes", "on")
+
     # Output Configuration
     @property
     def output_directory(self) -> Path:
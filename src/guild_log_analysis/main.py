@@ -5,13 +5,10 @@ This module provides a simple interface for analyzing guild logs
 without complex logic implementation.
 """
 
-import importlib
 import logging
-import pkgutil
 from typing import Any
 
-from . import analysis
-from .analysis.registry import get_registered_bosses
+from .analysis.registry import discover_boss_modules, get_registered_bosses
 from .api.auth import get_access_token
 from .api.client import WarcraftLogsAPIClient
 from .config.logging_config import setup_logging
@@ -76,23 +73,7 @@ class GuildLogAnalyzer:
 
     def _import_boss_modules(self) -> None:
         """Import all boss analysis modules to ensure they're registered."""
-        # Import the bosses package
-        bosses_package = f"{analysis.__name__}.bosses"
-
-        try:
-            bosses_module = importlib.import_module(bosses_package)
-
-            # Import all modules in the bosses package
-            for _, module_name, _ in pkgutil.iter_modules(bosses_module.__path__):
-                if module_name != "__init__":
-                    full_module_name = f"{bosses_package}.{module_name}"
-                    try:
-                        importlib.import_module(full_module_name)
-                        logger.debug(f"Imported boss module: {full_module_name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to import boss module {full_module_name}: {e}")
-        except Exception as e:
-            logger.warning(f"Failed to import bosses package: {e}")
+        discover_boss_modules()
 
     def _create_analyze_method(self, boss_name: str, boss_class):
         """
@@ -103,16 +84,17 @@ class GuildLogAnalyzer:
         :return: The analyze method function
         """
 
-        def analyze_method(report_codes: list[str]) -> None:
+        def analyze_method(report_codes: list[str], invalidate: bool = False) -> None:
             analysis = boss_class(self.api_client)
             logger.info(f"Initialized {boss_name} analysis for {len(report_codes)} reports")
-            analysis.analyze(report_codes)
+            analysis.analyze(report_codes, invalidate=invalidate)
             self.analyses[boss_name] = analysis
 
         # Set proper method name and docstring
         analyze_method.__name__ = f"analyze_{boss_name}"
         analyze_method.__doc__ = (
             f"Analyze {boss_name} encounters.\n\n:param report_codes: List of Warcraft Logs report codes to analyze"
+            "\n:param invalidate: Recompute the reports instead of loading their persisted results"
         )
 
         return analyze_method
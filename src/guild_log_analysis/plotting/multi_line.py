@@ -9,6 +9,7 @@ import logging
 import os
 import re
 from datetime import datetime
+from operator import itemgetter
 from typing import Optional
 
 import matplotlib.pyplot as plt
@@ -103,7 +104,7 @@ class MultiLinePlot:
                 parsed_dates.append((datetime.now(), date_str))
 
         # Sort by parsed date
-        parsed_dates.sort(key=lambda x: x[0])
+        parsed_dates.sort(key=itemgetter(0))
         self.dates = [date_str for _, date_str in parsed_dates]
 
         # Organize data by player
@@ -146,8 +147,9 @@ class MultiLinePlot:
         line_styles = ["-", "--", "-.", ":", (0, (3, 5, 1, 5))]
 
         # Calculate attendance for each player (number of dates they appear in)
+        attendance = {}
         for player, data in self.player_data.items():
-            data["attendance"] = len(data["dates"])
+            data["attendance"] = attendance[player] = len(data["dates"])
 
         # Group players by class
         class_players = {}
@@ -160,9 +162,7 @@ class MultiLinePlot:
         # Assign line styles within each class, prioritizing by attendance
         for player_class, players in class_players.items():
             # Sort players by attendance (highest first) for line style assignment
-            players_sorted_by_attendance = sorted(
-                players, key=lambda p: self.player_data[p]["attendance"], reverse=True
-            )
+            players_sorted_by_attendance = sorted(players, key=attendance.__getitem__, reverse=True)
 
             for i, player in enumerate(players_sorted_by_attendance):
                 style_index = i % len(line_styles)
@@ -11,6 +11,11 @@ import logging
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "speedups" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,6 +48,9 @@ def safe_json_load(file_path: Path) -> Optional[dict[str, Any]]:
     :returns: Loaded data or None if failed
     """
     try:
+        if orjson is not None:
+            with open(file_path, "rb") as f:
+                return orjson.loads(f.read())
         with open(file_path, "r", encoding="utf-8") as f:
             return json.load(f)
     except (json.JSONDecodeError, IOError) as e:
@@ -24,6 +24,9 @@ def configure_test_environment():
     # Set output directory for tests to keep all test outputs in tests/output/
     os.environ["OUTPUT_DIRECTORY"] = "tests"
 
+    # Keep analyses from reusing or writing persisted report results between tests
+    os.environ["REPORT_CACHE_ENABLED"] = "false"
+
     # Ensure test output directories exist
     test_output_dirs = ["tests/output/plots", "tests/output/cache", "tests/output/logs"]
 
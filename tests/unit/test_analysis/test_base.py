@@ -1,11 +1,16 @@
 """Tests for base analysis functionality."""
 
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from typing import Set
 from unittest.mock import patch
 
 import pytest
 
 from src.guild_log_analysis.analysis.base import BossAnalysisBase
+from src.guild_log_analysis.config.settings import Settings
 
 
 class ConcreteBossAnalysis(BossAnalysisBase):
@@ -80,6 +85,40 @@ class ConfigurationBasedAnalysis(BossAnalysisBase):
     ]
 
 
+class RecordingPlot:
+    """Picklable plot stub that records created plots and writes a file per saved plot."""
+
+    created: list["RecordingPlot"] = []
+
+    def __init__(self, **kwargs):
+        """Record the plot and its arguments."""
+        self.kwargs = kwargs
+        RecordingPlot.created.append(self)
+
+    def save(self):
+        title = self.kwargs["title"]
+        if title == "Broken":
+            raise RuntimeError("render failed")
+        path = Settings().plots_directory / f"{title}.txt"
+        path.write_text(title)
+        return str(path)
+
+
+class RecordingPlotAnalysis(ConfigurationBasedAnalysis):
+    """Configuration-based analysis with RecordingPlot registered as plot type."""
+
+    PLOT_TYPES = {**BossAnalysisBase.PLOT_TYPES, "RecordingPlot": RecordingPlot}
+
+
+@pytest.fixture
+def created_plots(tmp_path):
+    """Collect the plots created through RecordingPlot during a test, saving them to a temporary directory."""
+    RecordingPlot.created.clear()
+    with patch.dict(os.environ, {"OUTPUT_DIRECTORY": str(tmp_path)}):
+        yield RecordingPlot.created
+    RecordingPlot.created.clear()
+
+
 class TestBossAnalysisBase:
     """Test cases for BossAnalysisBase class."""
 
@@ -93,6 +132,11 @@ class TestBossAnalysisBase:
         assert analysis.encounter_id == 1234  # Set in ConcreteBossAnalysis
         assert analysis.results == []
 
+    def test_name_to_key(self):
+        """Test that analysis names are converted to snake_case result keys."""
+        assert BossAnalysisBase._name_to_key("Overload! Interrupts") == "overload_interrupts"
+        assert BossAnalysisBase._name_to_key("  Premium  Dynamite-Booty ") == "premium_dynamite_booty"
+
     def test_get_start_time_success(self, mock_api_client, sample_api_response):
         """Test successful start time retrieval."""
         mock_api_client.make_request.return_value = sample_api_response
@@ -153,6 +197,160 @@ class TestBossAnalysisBase:
 
         assert result is None
 
+    def test_parse_participants_keeps_first_role_of_duplicates(self, mock_api_client):
+        """Test that players listed in several roles appear once with their first role, counted before dedup."""
+        player_details = {
+            "data": {
+                "playerDetails": {
+                    "tanks": [{"id": 1, "name": "Swapper", "type": "Druid"}],
+                    "dps": [{"id": 2, "name": "Swapper", "type": "Druid"}, {"id": 3, "name": "Mage", "type": "Mage"}],
+                }
+            }
+        }
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+
+        with patch("src.guild_log_analysis.analysis.base.logger") as mock_logger:
+            players = analysis._parse_participants(player_details)
+
+        assert players == [
+            {"id": 1, "name": "Swapper", "type": "druid", "role": "tank"},
+            {"id": 3, "name": "Mage", "type": "mage", "role": "dps"},
+        ]
+        mock_logger.info.assert_any_call("Found a total of 3 players before deduplication.")
+
+    def test_get_participants_is_cached_per_report(self, mock_api_client, sample_player_details_response):
+        """Test that participants are fetched once per report and fight set."""
+        mock_api_client.make_request.return_value = sample_player_details_response
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        first = analysis.get_participants("test_report", {1, 2})
+        second = analysis.get_participants("test_report", {2, 1})
+        analysis.get_participants("other_report", {1, 2})
+
+        assert first == second
+        assert mock_api_client.make_request.call_count == 2
+
+    def test_get_start_time_failure_is_not_cached(self, mock_api_client, sample_api_response):
+        """Test that failed lookups are retried instead of cached."""
+        mock_api_client.make_request.side_effect = [
+            {"data": {"reportData": {"report": None}}},
+            sample_api_response,
+        ]
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+
+        assert analysis.get_start_time("test_report", {1, 2}) is None
+        assert analysis.get_start_time("test_report", {1, 2}) == 1640995200.0
+
+    def test_get_fight_ids_seeds_report_metadata(
+        self, mock_api_client, sample_api_response, sample_player_details_response
+    ):
+        """Test that one metadata query serves all per-report lookups."""
+        report = sample_api_response["data"]["reportData"]["report"]
+        report["playerDetails"] = sample_player_details_response["data"]["reportData"]["report"]["playerDetails"]
+        mock_api_client.make_request.return_value = sample_api_response
+
+        analysis = BossAnalysisBase(mock_api_client)
+        fight_ids = analysis.get_fight_ids("test_report")
+
+        assert fight_ids == {1, 2}
+        assert analysis.get_start_time("test_report", fight_ids) == 1640995200.0
+        assert analysis.get_total_fight_duration("test_report", fight_ids) == 600000
+        assert len(analysis.get_participants("test_report", fight_ids)) == 3
+        mock_api_client.make_request.assert_called_once()
+
+    def test_get_player_details_reuses_report_metadata(
+        self, mock_api_client, sample_api_response, sample_player_details_response
+    ):
+        """Test that progress plot roles come from the cached participants without another query."""
+        report = sample_api_response["data"]["reportData"]["report"]
+        report["playerDetails"] = sample_player_details_response["data"]["reportData"]["report"]["playerDetails"]
+        mock_api_client.make_request.return_value = sample_api_response
+
+        analysis = BossAnalysisBase(mock_api_client)
+        fight_ids = analysis.get_fight_ids("test_report")
+
+        assert analysis._get_player_details("test_report", fight_ids) == {
+            "TestPlayer1": "tanks_healers",
+            "TestPlayer2": "tanks_healers",
+            "TestPlayer3": "dps",
+        }
+        mock_api_client.make_request.assert_called_once()
+
+    def test_generate_progress_plot_reads_metric_reports_newest_per_date(self, mock_api_client):
+        """Test that progress data comes from reports holding the metric, filtered by role."""
+
+        def report(code, starttime, interrupts):
+            players = [
+                {"player_name": "Tank", "role": "tank", "interrupts": interrupts},
+                {"player_name": "Mage", "role": "dps", "interrupts": interrupts},
+            ]
+            return {"starttime": starttime, "reportCode": code, "analysis": [{"name": "Kicks", "data": players}]}
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.results = [
+            report("late", 1641125400.0, 3),
+            {"starttime": 1641126000.0, "reportCode": "other", "analysis": [{"name": "Other", "data": []}]},
+            report("early", 1641124800.0, 1),
+        ]
+
+        with patch.object(analysis, "_create_and_save_progress_plot") as mock_save:
+            analysis._generate_progress_plot("Kicks", {"column_key": "interrupts", "y_axis_label": "Kicks"}, ["dps"])
+
+        date_data = mock_save.call_args[0][1]
+        assert len(date_data) == 1
+        assert next(iter(date_data.values())).to_dict("records") == [
+            {"player_name": "Mage", "role": "dps", "interrupts": 3}
+        ]
+
+    def test_generate_progress_plots_saves_all_plots_together(self, mock_api_client):
+        """Test that progress plots are queued and handed to the plot workers in one batch."""
+
+        class ProgressAnalysis(ConcreteBossAnalysis):
+            CONFIG = [
+                {"name": name, "progress_plot": {"enabled": True, "column_key": "interrupts", "y_axis_label": name}}
+                for name in ("Kicks", "Stuns")
+            ]
+
+        players = [{"player_name": "Mage", "class": "mage", "interrupts": 2}]
+        analysis = ProgressAnalysis(mock_api_client)
+        analysis.results = [
+            {
+                "starttime": 1641124800.0,
+                "analysis": [{"name": "Kicks", "data": players}, {"name": "Stuns", "data": players}],
+            }
+        ]
+
+        with patch.object(analysis, "_save_plots") as mock_save_plots:
+            analysis._generate_progress_plots()
+
+        mock_save_plots.assert_called_once()
+        titles = [title for title, _ in mock_save_plots.call_args[0][0]]
+        assert titles == ["Kicks Progress Over Time", "Stuns Progress Over Time"]
+
+    def test_get_fight_ids_seeds_actors_for_damage_to_actor(self, mock_api_client, sample_api_response):
+        """Test that damage_to_actor configurations get their actors from the metadata query."""
+        report = sample_api_response["data"]["reportData"]["report"]
+        report["masterData"] = {"actors": [{"id": 10, "gameID": 67890}, {"id": 11, "gameID": 67890}]}
+        mock_api_client.make_request.return_value = sample_api_response
+
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+        analysis.get_fight_ids("test_report")
+
+        assert mock_api_client.make_request.call_args[0][1]["includeActors"] is True
+        assert analysis.get_actor_ids_by_game_id("test_report") == {67890: [10, 11]}
+        mock_api_client.make_request.assert_called_once()
+
+    def test_get_fight_ids_skips_actors_without_damage_to_actor(self, mock_api_client, sample_api_response):
+        """Test that actors are not requested when no analysis needs them."""
+        mock_api_client.make_request.return_value = sample_api_response
+
+        analysis = BossAnalysisBase(mock_api_client)
+        analysis.get_fight_ids("test_report")
+
+        assert mock_api_client.make_request.call_args[0][1]["includeActors"] is False
+
     def test_find_analysis_data_success(self, mock_api_client, sample_analysis_results):
         """Test successful analysis data finding."""
         analysis = ConcreteBossAnalysis(mock_api_client)
@@ -167,6 +365,95 @@ class TestBossAnalysisBase:
         assert "TestPlayer2" in previous_dict
         assert previous_dict["TestPlayer2"] == 1
 
+    def test_find_analysis_data_falls_back_to_older_reports(self, mock_api_client, sample_analysis_results):
+        """Test that players missing from the previous report use older reports."""
+        previous_analysis = sample_analysis_results[1]["analysis"][0]
+        previous_analysis["data"] = previous_analysis["data"][:1]
+        older_report = {
+            "starttime": 1640995000.0,
+            "reportCode": "older_report",
+            "analysis": [
+                {
+                    "name": "Overload! Interrupts",
+                    "data": [
+                        {"player_name": "TestPlayer1", "interrupts": 9},
+                        {"player_name": "TestPlayer2", "interrupts": 7},
+                    ],
+                }
+            ],
+        }
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.results = sample_analysis_results + [older_report]
+
+        _, previous_dict = analysis.find_analysis_data("Overload! Interrupts", "interrupts", "player_name")
+
+        assert previous_dict == {"TestPlayer1": 3, "TestPlayer2": 7}
+
+    def test_find_analysis_data_uses_first_previous_entry_of_current_players(
+        self, mock_api_client, sample_analysis_results
+    ):
+        """Test that only the first entry per player counts and absent players are ignored."""
+        sample_analysis_results[1]["analysis"][0]["data"] = [
+            {"player_name": "TestPlayer1", "interrupts": 4},
+            {"player_name": "TestPlayer1", "interrupts": 8},
+            {"player_name": "Benched", "interrupts": 2},
+        ]
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.results = sample_analysis_results
+
+        _, previous_dict = analysis.find_analysis_data("Overload! Interrupts", "interrupts", "player_name")
+
+        assert previous_dict == {"TestPlayer1": 4}
+
+    def test_find_analysis_data_reindexes_new_results(self, mock_api_client, sample_analysis_results):
+        """Test that the analysis index picks up reports added after a lookup."""
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.results = list(sample_analysis_results)
+        analysis.find_analysis_data("Overload! Interrupts", "interrupts", "player_name")
+
+        newer_data = [{"player_name": "TestPlayer1", "interrupts": 8}]
+        analysis.results.append(
+            {
+                "starttime": 1641081600.0,
+                "reportCode": "newer_report",
+                "analysis": [{"name": "Overload! Interrupts", "data": newer_data}],
+            }
+        )
+
+        current_data, previous_dict = analysis.find_analysis_data("Overload! Interrupts", "interrupts", "player_name")
+
+        assert current_data == newer_data
+        assert previous_dict == {"TestPlayer1": 5}
+
+    def test_index_results_orders_newest_first_keeping_ties_in_order(self, mock_api_client):
+        """Test that results are ordered by starttime with equal starttimes kept in insertion order."""
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.results = [
+            {"starttime": 100.0, "reportCode": "a", "analysis": []},
+            {"starttime": 300.0, "reportCode": "b", "analysis": []},
+            {"starttime": 100.0, "reportCode": "c", "analysis": []},
+        ]
+
+        order = analysis._index_results().order
+
+        assert [analysis.results[position]["reportCode"] for position in order] == ["b", "a", "c"]
+
+    def test_get_previous_report_returns_newest_earlier_report(self, mock_api_client):
+        """Test that the previous report is the newest one that started strictly earlier."""
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.results = [
+            {"starttime": 200.0, "reportCode": "b", "analysis": []},
+            {"starttime": 100.0, "reportCode": "a", "analysis": []},
+            {"starttime": 300.0, "reportCode": "c", "analysis": []},
+        ]
+
+        assert analysis._get_previous_report(300.0)["reportCode"] == "b"
+        assert analysis._get_previous_report(250.0)["reportCode"] == "b"
+        assert analysis._get_previous_report(200.0)["reportCode"] == "a"
+        assert analysis._get_previous_report(100.0) is None
+
     def test_find_analysis_data_not_found(self, mock_api_client):
         """Test analysis data finding with no matching analysis."""
         analysis = ConcreteBossAnalysis(mock_api_client)
@@ -205,6 +492,47 @@ class TestBossAnalysisBase:
         player1_data = next((p for p in result if p["player_name"] == "TestPlayer1"), None)
         assert player1_data is not None
 
+    def test_get_damage_to_actor_aggregates_multiple_targets(
+        self, mock_api_client, sample_actors_response, sample_damage_response, sample_players_data
+    ):
+        """Test that damage from concurrently queried targets is summed."""
+        actors = sample_actors_response["data"]["reportData"]["report"]["masterData"]["actors"]
+        actors.append({**actors[0], "id": 101})
+
+        def make_request(query, variables):
+            if "targetID" in variables:
+                return sample_damage_response
+            return sample_actors_response
+
+        mock_api_client.make_request.side_effect = make_request
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.get_damage_to_actor("test_report", {1, 2}, 231027, sample_players_data)
+
+        damage = {p["player_name"]: p["damage"] for p in result}
+        assert damage == {"TestPlayer1": 2000000, "TestPlayer2": 1600000, "TestPlayer3": 1200000}
+        target_ids = sorted(c.args[1]["targetID"] for c in mock_api_client.make_request.call_args_list[1:])
+        assert target_ids == [100, 101]
+
+    def test_get_damage_to_actor_reuses_actors_per_report(
+        self, mock_api_client, sample_actors_response, sample_damage_response, sample_players_data
+    ):
+        """Test that the actors list is fetched once per report for several damage analyses."""
+
+        def make_request(query, variables):
+            if "targetID" in variables:
+                return sample_damage_response
+            return sample_actors_response
+
+        mock_api_client.make_request.side_effect = make_request
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.get_damage_to_actor("test_report", {1, 2}, 231027, sample_players_data)
+        analysis.get_damage_to_actor("test_report", {1, 2}, 231027, sample_players_data)
+
+        actor_queries = [c for c in mock_api_client.make_request.call_args_list if "targetID" not in c.args[1]]
+        assert len(actor_queries) == 1
+
     def test_get_damage_to_actor_no_targets(self, mock_api_client, sample_players_data):
         """Test damage to actor retrieval with no matching targets."""
         # Mock actors response with no matching game ID
@@ -240,6 +568,193 @@ class TestBossAnalysisBase:
 
         assert result == []
 
+    def test_get_batched_table_data_splits_aliases(self, mock_api_client):
+        """Test that batched table data is fetched once and split per configuration."""
+        debuff_table = {"data": {"auras": [], "totalTime": 1000}}
+        damage_table = {"data": {"entries": []}}
+        mock_api_client.make_request.return_value = {
+            "data": {"reportData": {"report": {"table0": debuff_table, "table1": damage_table}}}
+        }
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        configs = [
+            {"ability_id": 111, "data_type": "Debuffs"},
+            {"ability_id": 222, "data_type": "DamageTaken", "wipe_cutoff": 2},
+        ]
+        tables = analysis.get_batched_table_data("test_report", configs, {1, 2})
+
+        assert tables == [debuff_table, damage_table]
+        mock_api_client.make_request.assert_called_once()
+        query, variables = mock_api_client.make_request.call_args[0]
+        assert "table0: table(" in query and "table1: table(" in query
+        assert variables["abilityID1"] == 222
+        assert variables["wipeCutoff1"] == 2
+        assert variables["fightIDs"] == [1, 2]
+
+    def test_prefetch_table_data_maps_tables_to_config_indices(self, mock_api_client):
+        """Test that prefetched tables are keyed by CONFIG index and missing tables are left out."""
+        debuff_table = {"data": {"auras": [], "totalTime": 1000}}
+        mock_api_client.make_request.return_value = {
+            "data": {"reportData": {"report": {"table0": debuff_table, "table1": None}}}
+        }
+
+        class TableAnalysis(ConcreteBossAnalysis):
+            CONFIG = [
+                {"name": "Debuff", "analysis": {"type": "table_data", "ability_id": 111, "data_type": "Debuffs"}},
+                {"name": "Kicks", "analysis": {"type": "interrupts", "ability_id": 222}},
+                {"name": "Damage", "analysis": {"type": "table_data", "ability_id": 333, "data_type": "DamageTaken"}},
+            ]
+
+        analysis = TableAnalysis(mock_api_client)
+
+        assert analysis._prefetch_table_data("test_report", [1, 2]) == {0: debuff_table}
+        _, variables = mock_api_client.make_request.call_args[0]
+        assert (variables["abilityID0"], variables["abilityID1"]) == (111, 333)
+
+    def test_prefetch_table_data_includes_first_interrupt_page(self, mock_api_client, sample_players_data):
+        """Test that the first interrupt events page is fetched with the tables and reused by the analysis."""
+        debuff_table = {"data": {"auras": [], "totalTime": 1000}}
+        interrupt_page = {"data": [{"type": "interrupt", "sourceID": 1}], "nextPageTimestamp": None}
+        mock_api_client.make_request.return_value = {
+            "data": {"reportData": {"report": {"table0": debuff_table, "interrupts0": interrupt_page}}}
+        }
+
+        class MixedAnalysis(ConcreteBossAnalysis):
+            CONFIG = [
+                {"name": "Debuff", "analysis": {"type": "table_data", "ability_id": 111, "data_type": "Debuffs"}},
+                {"name": "Kicks", "analysis": {"type": "interrupts", "ability_id": 222, "wipe_cutoff": 2}},
+            ]
+
+        analysis = MixedAnalysis(mock_api_client)
+        prefetched = analysis._prefetch_table_data("test_report", [1, 2])
+
+        assert prefetched == {0: debuff_table, 1: interrupt_page}
+        query, variables = mock_api_client.make_request.call_args[0]
+        assert "interrupts0: events(dataType: Interrupts" in query
+        assert (variables["interruptAbilityID0"], variables["interruptWipeCutoff0"]) == (222.0, 2)
+
+        mock_api_client.make_request.reset_mock()
+        result = analysis.analyze_interrupts(
+            "test_report", [1, 2], sample_players_data, 222.0, first_page=prefetched[1]
+        )
+
+        mock_api_client.make_request.assert_not_called()
+        assert {row["player_name"]: row["interrupts"] for row in result}["TestPlayer1"] == 1
+
+    def test_summarize_fight_times(self):
+        """Test earliest start and total duration of fights."""
+        fights = [
+            {"id": 2, "startTime": 5000, "endTime": 9000},
+            {"id": 1, "startTime": 1000, "endTime": 3000},
+        ]
+
+        assert BossAnalysisBase._summarize_fight_times(fights) == (1000, 6000)
+
+    def test_fight_id_list_sorts_sets_and_reuses_lists(self):
+        """Test that fight IDs are sorted once and materialized lists are passed through."""
+        fight_ids_list = [1, 2, 3]
+
+        assert BossAnalysisBase._fight_id_list({3, 1, 2}) == [1, 2, 3]
+        assert BossAnalysisBase._fight_id_list(fight_ids_list) is fight_ids_list
+
+    def test_analyze_table_data_uses_prefetched_table(self, mock_api_client, sample_players_data):
+        """Test that prefetched table data skips the individual table query."""
+        table = {"data": {"auras": [{"name": "TestPlayer1", "totalUptime": 500, "totalUses": 3}], "totalTime": 1000}}
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        with patch.object(analysis, "get_table_data") as mock_get_table_data:
+            result = analysis.analyze_table_data(
+                "test_report",
+                {"ability_id": 111, "data_type": "Debuffs"},
+                {1, 2},
+                sample_players_data,
+                table_data=table,
+            )
+
+        mock_get_table_data.assert_not_called()
+        player1_data = next(p for p in result if p["player_name"] == "TestPlayer1")
+        assert player1_data["uptime_percentage"] == 50.0
+
+    def test_analyze_table_data_rejects_debuffs_without_fight_time(self, mock_api_client, sample_players_data):
+        """Test that a Debuffs table with zero total time yields no rows instead of infinite uptimes."""
+        table = {"data": {"auras": [{"name": "TestPlayer1", "totalUptime": 500, "totalUses": 3}], "totalTime": 0}}
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_table_data(
+            "test_report", {"ability_id": 111, "data_type": "Debuffs"}, {1, 2}, sample_players_data, table_data=table
+        )
+
+        assert result == []
+
+    def test_analyze_table_data_parses_json_string(self, mock_api_client, sample_players_data):
+        """Test that table data given as a raw JSON string is decoded before processing."""
+        table = '{"data": {"auras": [{"name": "TestPlayer1", "totalUptime": 250, "totalUses": 2}], "totalTime": 1000}}'
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_table_data(
+            "test_report", {"ability_id": 111, "data_type": "Debuffs"}, {1, 2}, sample_players_data, table_data=table
+        )
+
+        player1_data = next(p for p in result if p["player_name"] == "TestPlayer1")
+        assert (player1_data["uptime_percentage"], player1_data["hit_count"]) == (25.0, 2)
+
+    def test_analyze_table_data_deduplicates_players_with_defaults(self, mock_api_client, sample_players_data):
+        """Test that players appear once and missing players get the data type's default metrics."""
+        table = {"data": {"entries": [{"name": "TestPlayer1", "total": 900, "hitCount": 3}]}}
+        report_players = sample_players_data + [{**sample_players_data[0], "id": 9, "role": "dps"}]
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_table_data(
+            "test_report", {"ability_id": 111, "data_type": "DamageTaken"}, {1, 2}, report_players, table_data=table
+        )
+
+        assert [p["player_name"] for p in result] == ["TestPlayer1", "TestPlayer2", "TestPlayer3"]
+        assert result[0]["role"] == sample_players_data[0]["role"]
+        assert result[0]["damage_taken"] == 900
+        assert result[1] == {
+            "player_name": "TestPlayer2",
+            "class": sample_players_data[1]["type"],
+            "role": sample_players_data[1]["role"],
+            "damage_taken": 0,
+            "total_reduced": 0,
+            "overheal": 0,
+            "hit_count": 0,
+        }
+
+    def test_analyze_table_data_survivability_skips_fights_without_data(self, mock_api_client, sample_players_data):
+        """Test that survivability averages and counts only fights with data."""
+        table = {
+            "data": {
+                "players": [
+                    {"name": "TestPlayer1", "fights": {"1": 0.5, "2": None, "3": 0.755}},
+                    {"name": "TestPlayer2", "fights": {"1": None}},
+                ]
+            }
+        }
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_table_data(
+            "test_report",
+            {"ability_id": 0, "data_type": "Survivability"},
+            {1, 2},
+            sample_players_data,
+            table_data=table,
+        )
+
+        metrics = {p["player_name"]: (p["survivability_percentage"], p["hit_count"]) for p in result}
+        assert metrics == {"TestPlayer1": (62.75, 2), "TestPlayer2": (0.0, 0), "TestPlayer3": (0.0, 0)}
+
+    def test_analyze_table_data_ignores_non_participants(self, mock_api_client, sample_players_data):
+        """Test that entries of actors outside the report players are skipped."""
+        table = {"data": {"entries": [{"name": "TestPlayer1"}, {"name": "Outsider"}, {"name": "TestPlayer1"}]}}
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_table_data(
+            "test_report", {"ability_id": 0, "data_type": "Deaths"}, {1, 2}, sample_players_data, table_data=table
+        )
+
+        assert {p["player_name"]: p["deaths"] for p in result} == {"TestPlayer1": 2, "TestPlayer2": 0, "TestPlayer3": 0}
+
     def test_analyze_interrupts_success(self, mock_api_client, sample_interrupt_events, sample_players_data):
         """Test successful interrupt analysis."""
         mock_api_client.make_request.return_value = sample_interrupt_events
@@ -254,6 +769,86 @@ class TestBossAnalysisBase:
         player1_data = next((p for p in result if p["player_name"] == "TestPlayer1"), None)
         assert player1_data is not None
 
+    def test_analyze_interrupts_counts_by_source_id(
+        self, mock_api_client, sample_interrupt_events, sample_players_data
+    ):
+        """Test that interrupts are attributed to players by source ID."""
+        mock_api_client.make_request.return_value = sample_interrupt_events
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_interrupts("test_report", {1, 2}, sample_players_data, 460582.0)
+
+        counts = {p["player_name"]: p["interrupts"] for p in result}
+        assert counts == {"TestPlayer1": 1, "TestPlayer2": 1, "TestPlayer3": 0}
+
+    def test_index_players_shares_slot_between_ids_of_one_name(self):
+        """Test that all actor IDs of a player name map to the same slot."""
+        report_players = [
+            {"id": 1, "name": "TestPlayer1"},
+            {"id": 2, "name": "TestPlayer2"},
+            {"id": 7, "name": "TestPlayer1"},
+        ]
+
+        player_slots, slot_by_id = BossAnalysisBase._index_players(report_players)
+
+        assert player_slots == {"TestPlayer1": 0, "TestPlayer2": 1}
+        assert slot_by_id == {1: 0, 2: 1, 7: 0}
+
+    def test_count_events_by_player_ignores_unknown_sources(self, sample_players_data):
+        """Test that events from unknown or missing source IDs are not counted."""
+        events = [{"sourceID": 3}, {"sourceID": 99}, {"sourceID": None}, {}, {"sourceID": 3}, {"sourceID": 1}]
+
+        counts = BossAnalysisBase._count_events_by_player(events, "sourceID", sample_players_data)
+
+        assert counts == {"TestPlayer1": 1, "TestPlayer2": 0, "TestPlayer3": 2}
+
+    def test_analyze_interrupts_deduplicates_players_by_name(
+        self, mock_api_client, sample_interrupt_events, sample_players_data
+    ):
+        """Test that a player listed in several roles yields one row with the first role."""
+        mock_api_client.make_request.return_value = sample_interrupt_events
+        players = sample_players_data + [{"name": "TestPlayer1", "type": "warrior", "role": "dps", "id": 1}]
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_interrupts("test_report", {1, 2}, players, 460582.0)
+
+        player1_rows = [p for p in result if p["player_name"] == "TestPlayer1"]
+        assert player1_rows == [{"player_name": "TestPlayer1", "class": "warrior", "role": "tank", "interrupts": 1}]
+
+    def test_analyze_interrupts_follows_next_page_timestamps(self, mock_api_client, sample_players_data):
+        """Test that later pages are fetched one after another for all fights instead of per fight."""
+
+        def events_response(events, next_page=None):
+            return {"data": {"reportData": {"report": {"events": {"data": events, "nextPageTimestamp": next_page}}}}}
+
+        pages = {
+            None: events_response([{"sourceID": 1}], next_page=1000),
+            1000: events_response([{"sourceID": 2}], next_page=2000),
+            2000: events_response([{"sourceID": 3}, {"sourceID": 3}]),
+        }
+        mock_api_client.make_request.side_effect = lambda query, variables: pages[variables["startTime"]]
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        result = analysis.analyze_interrupts("test_report", {1, 2}, sample_players_data, 460582.0)
+
+        counts = {p["player_name"]: p["interrupts"] for p in result}
+        assert counts == {"TestPlayer1": 1, "TestPlayer2": 1, "TestPlayer3": 2}
+        page_variables = [c.args[1] for c in mock_api_client.make_request.call_args_list]
+        assert [v["startTime"] for v in page_variables] == [None, 1000, 2000]
+        assert all(v["fightIds"] == [1, 2] for v in page_variables)
+
+    def test_analyze_interrupts_records_failure_on_invalid_page(self, mock_api_client, sample_players_data):
+        """Test that a missing page marks the report as failed so its partial counts are not persisted."""
+        first_page = {
+            "data": {"reportData": {"report": {"events": {"data": [{"sourceID": 1}], "nextPageTimestamp": 1000}}}}
+        }
+        mock_api_client.make_request.side_effect = [first_page, {}]
+
+        analysis = ConcreteBossAnalysis(mock_api_client)
+        analysis.analyze_interrupts("test_report", {1, 2}, sample_players_data, 460582.0)
+
+        assert "test_report" in analysis._failed_reports
+
 
 class TestConfigurationBasedAnalysis:
     """Test cases for configuration-based analysis functionality."""
@@ -278,8 +873,24 @@ class TestConfigurationBasedAnalysis:
 
         # Should use generic method since ANALYSIS_CONFIG exists
         assert mock_process_generic.call_count == 2
-        mock_process_generic.assert_any_call("report1")
-        mock_process_generic.assert_any_call("report2")
+        mock_process_generic.assert_any_call("report1", invalidate=False)
+        mock_process_generic.assert_any_call("report2", invalidate=False)
+
+    def test_analyze_generic_preserves_report_order(self, mock_api_client):
+        """Test that concurrently processed reports are stored in input order."""
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+        report_codes = ["slow", "medium", "fast"]
+        delays = {"slow": 0.06, "medium": 0.03, "fast": 0.0}
+
+        def process_report(report_code, invalidate=False):
+            time.sleep(delays[report_code])
+            analysis.results.append({"reportCode": report_code})
+
+        with patch.dict(os.environ, {"MAX_CONCURRENT_REQUESTS": "3"}):
+            with patch.object(analysis, "_process_report_generic", side_effect=process_report):
+                analysis.analyze(report_codes)
+
+        assert [result["reportCode"] for result in analysis.results] == report_codes
 
     def test_analyze_legacy_fallback(self, mock_api_client):
         """Test that analyze falls back to legacy method when no configuration."""
@@ -330,6 +941,202 @@ class TestConfigurationBasedAnalysis:
         assert result["fight_ids"] == {1, 2}
         assert len(result["analysis"]) == 4
 
+    @patch.object(ConfigurationBasedAnalysis, "get_fight_ids")
+    @patch.object(ConfigurationBasedAnalysis, "get_start_time")
+    @patch.object(ConfigurationBasedAnalysis, "get_participants")
+    @patch.object(ConfigurationBasedAnalysis, "_execute_analysis")
+    def test_process_report_generic_shares_analysis_configs(
+        self,
+        mock_execute_analysis,
+        mock_get_participants,
+        mock_get_start_time,
+        mock_get_fight_ids,
+        mock_api_client,
+        sample_players_data,
+    ):
+        """Test that analysis configurations are built once and shared across reports."""
+        mock_get_fight_ids.return_value = {1, 2}
+        mock_get_start_time.return_value = 1640995200.0
+        mock_get_participants.return_value = sample_players_data
+        mock_execute_analysis.return_value = []
+
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+        analysis._process_report_generic("first_report")
+        analysis._process_report_generic("second_report")
+
+        configs = [call.args[1] for call in mock_execute_analysis.call_args_list]
+        assert configs[0] is configs[4]
+        assert configs[1] == {
+            "name": "Test Damage",
+            "result_key": "test_damage",
+            "type": "damage_to_actor",
+            "target_game_id": 67890,
+        }
+
+    @patch.object(ConfigurationBasedAnalysis, "_is_report_finished", return_value=True)
+    @patch.object(ConfigurationBasedAnalysis, "get_fight_ids")
+    @patch.object(ConfigurationBasedAnalysis, "get_start_time")
+    @patch.object(ConfigurationBasedAnalysis, "get_participants")
+    @patch.object(ConfigurationBasedAnalysis, "_execute_analysis")
+    def test_process_report_generic_reuses_persisted_results(
+        self,
+        mock_execute_analysis,
+        mock_get_participants,
+        mock_get_start_time,
+        mock_get_fight_ids,
+        mock_is_report_finished,
+        mock_api_client,
+        sample_players_data,
+        tmp_path,
+    ):
+        """Test that complete report results are persisted and reused by later runs."""
+        mock_get_fight_ids.return_value = {2, 1}
+        mock_get_start_time.return_value = 1640995200.0
+        mock_get_participants.return_value = sample_players_data
+        mock_execute_analysis.return_value = [{"player_name": "TestPlayer1", "test_value": 100}]
+
+        env = {"REPORT_CACHE_ENABLED": "true", "CACHE_DIRECTORY": str(tmp_path)}
+        with patch.dict(os.environ, env):
+            ConfigurationBasedAnalysis(mock_api_client)._process_report_generic("test_report")
+            analysis = ConfigurationBasedAnalysis(mock_api_client)
+            analysis._process_report_generic("test_report")
+
+        mock_get_fight_ids.assert_called_once_with("test_report")
+        assert len(list((tmp_path / "reports").glob("test_report_*.json"))) == 1
+        assert analysis.results[0]["fight_ids"] == {1, 2}
+        assert analysis.results[0]["analysis"][0]["data"] == [{"player_name": "TestPlayer1", "test_value": 100}]
+
+    @patch.object(ConfigurationBasedAnalysis, "_is_report_finished", return_value=True)
+    @patch.object(ConfigurationBasedAnalysis, "get_fight_ids")
+    @patch.object(ConfigurationBasedAnalysis, "get_start_time")
+    @patch.object(ConfigurationBasedAnalysis, "get_participants")
+    @patch.object(ConfigurationBasedAnalysis, "_execute_analysis")
+    def test_process_report_generic_refreshes_persisted_results(
+        self,
+        mock_execute_analysis,
+        mock_get_participants,
+        mock_get_start_time,
+        mock_get_fight_ids,
+        mock_is_report_finished,
+        mock_api_client,
+        sample_players_data,
+        tmp_path,
+    ):
+        """Test that a requested refresh recomputes and overwrites persisted results."""
+        mock_get_fight_ids.return_value = {1, 2}
+        mock_get_start_time.return_value = 1640995200.0
+        mock_get_participants.return_value = sample_players_data
+        mock_execute_analysis.return_value = [{"player_name": "TestPlayer1", "test_value": 100}]
+
+        env = {"REPORT_CACHE_ENABLED": "true", "CACHE_DIRECTORY": str(tmp_path)}
+        with patch.dict(os.environ, env):
+            ConfigurationBasedAnalysis(mock_api_client)._process_report_generic("test_report")
+            mock_execute_analysis.return_value = [{"player_name": "TestPlayer1", "test_value": 200}]
+            with patch.dict(os.environ, {"REPORT_CACHE_REFRESH": "true"}):
+                ConfigurationBasedAnalysis(mock_api_client)._process_report_generic("test_report")
+            analysis = ConfigurationBasedAnalysis(mock_api_client)
+            analysis._process_report_generic("test_report")
+
+        assert mock_get_fight_ids.call_count == 2
+        assert analysis.results[0]["analysis"][0]["data"] == [{"player_name": "TestPlayer1", "test_value": 200}]
+
+    @patch.object(ConfigurationBasedAnalysis, "_is_report_finished", return_value=True)
+    @patch.object(ConfigurationBasedAnalysis, "get_fight_ids")
+    @patch.object(ConfigurationBasedAnalysis, "get_start_time")
+    @patch.object(ConfigurationBasedAnalysis, "get_participants")
+    @patch.object(ConfigurationBasedAnalysis, "_execute_analysis")
+    def test_analyze_invalidate_recomputes_only_given_reports(
+        self,
+        mock_execute_analysis,
+        mock_get_participants,
+        mock_get_start_time,
+        mock_get_fight_ids,
+        mock_is_report_finished,
+        mock_api_client,
+        sample_players_data,
+        tmp_path,
+    ):
+        """Test that invalidating a report recomputes it while other reports keep their persisted results."""
+        mock_get_fight_ids.return_value = {1, 2}
+        mock_get_start_time.return_value = 1640995200.0
+        mock_get_participants.return_value = sample_players_data
+        mock_execute_analysis.return_value = [{"player_name": "TestPlayer1", "test_value": 100}]
+
+        env = {"REPORT_CACHE_ENABLED": "true", "CACHE_DIRECTORY": str(tmp_path), "MAX_CONCURRENT_REQUESTS": "1"}
+        with patch.dict(os.environ, env):
+            ConfigurationBasedAnalysis(mock_api_client).analyze(["bad_report", "good_report"])
+            mock_execute_analysis.return_value = [{"player_name": "TestPlayer1", "test_value": 200}]
+            ConfigurationBasedAnalysis(mock_api_client).analyze(["bad_report"], invalidate=True)
+            analysis = ConfigurationBasedAnalysis(mock_api_client)
+            analysis.analyze(["bad_report", "good_report"])
+
+        values = {result["reportCode"]: result["analysis"][0]["data"][0]["test_value"] for result in analysis.results}
+        assert values == {"bad_report": 200, "good_report": 100}
+        assert mock_get_fight_ids.call_count == 3
+
+    @pytest.mark.parametrize("failed, finished", [(True, True), (False, False)])
+    @patch.object(ConfigurationBasedAnalysis, "get_fight_ids")
+    @patch.object(ConfigurationBasedAnalysis, "get_start_time")
+    @patch.object(ConfigurationBasedAnalysis, "get_participants")
+    def test_process_report_generic_does_not_persist_incomplete_results(
+        self,
+        mock_get_participants,
+        mock_get_start_time,
+        mock_get_fight_ids,
+        failed,
+        finished,
+        mock_api_client,
+        sample_players_data,
+        tmp_path,
+    ):
+        """Test that results with a failed analysis or of a report still being logged are not persisted."""
+        mock_get_fight_ids.return_value = {1, 2}
+        mock_get_start_time.return_value = 1640995200.0
+        mock_get_participants.return_value = sample_players_data
+
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+
+        def execute_analysis(report_code, *args):
+            # Analyzers log their errors and fall back to an empty result
+            if failed:
+                analysis._record_failure(report_code)
+            return []
+
+        env = {"REPORT_CACHE_ENABLED": "true", "CACHE_DIRECTORY": str(tmp_path)}
+        with patch.dict(os.environ, env), patch.object(analysis, "_execute_analysis", side_effect=execute_analysis):
+            with patch.object(analysis, "_is_report_finished", return_value=finished):
+                analysis._process_report_generic("test_report")
+
+        assert len(analysis.results) == 1
+        assert not (tmp_path / "reports").exists() or not any((tmp_path / "reports").iterdir())
+
+    def test_is_report_finished_uses_report_end_time(self, mock_api_client, sample_api_response):
+        """Test that only reports that ended long enough ago count as finished."""
+        report = sample_api_response["data"]["reportData"]["report"]
+        mock_api_client.make_request.return_value = sample_api_response
+        analysis = BossAnalysisBase(mock_api_client)
+
+        report["endTime"] = (time.time() - 60) * 1000
+        analysis.get_fight_ids("live_report")
+        report["endTime"] = 1641002200000
+        analysis.get_fight_ids("old_report")
+
+        assert analysis._is_report_finished("live_report") is False
+        assert analysis._is_report_finished("old_report") is True
+        assert analysis._is_report_finished("unknown_report") is False
+
+    def test_report_cache_path_depends_on_package_version(self, mock_api_client, tmp_path):
+        """Test that results persisted by another package version are not reused."""
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+
+        env = {"REPORT_CACHE_ENABLED": "true", "CACHE_DIRECTORY": str(tmp_path)}
+        with patch.dict(os.environ, env):
+            path = analysis._report_cache_path("test_report")
+            with patch("src.guild_log_analysis.analysis.base.__version__", "0.0.0"):
+                other_path = analysis._report_cache_path("test_report")
+
+        assert path != other_path
+
     @patch.object(ConfigurationBasedAnalysis, "analyze_interrupts")
     def test_execute_analysis_interrupts(self, mock_analyze_interrupts, mock_api_client, sample_players_data):
         """Test execute_analysis with interrupts configuration."""
@@ -380,6 +1187,55 @@ class TestConfigurationBasedAnalysis:
         with pytest.raises(ValueError, match="Unknown analysis type: unknown_type"):
             analysis._execute_analysis("test_report", config, {1, 2}, sample_players_data)
 
+    def test_execute_analysis_dispatches_subclass_handler(self, mock_api_client, sample_players_data):
+        """Test that subclasses can register handlers for custom analysis types."""
+
+        class CustomHandlerAnalysis(ConfigurationBasedAnalysis):
+            ANALYSIS_HANDLERS = {**BossAnalysisBase.ANALYSIS_HANDLERS, "custom": "_handle_custom"}
+
+            def _handle_custom(self, report_code, config, fight_ids, players):
+                return [{"player_name": player["name"], "value": config["value"]} for player in players]
+
+        analysis = CustomHandlerAnalysis(mock_api_client)
+        config = {"name": "Custom", "type": "custom", "value": 7, "roles": ["healer"]}
+
+        result = analysis._execute_analysis("test_report", config, {1, 2}, sample_players_data)
+
+        assert result == [{"player_name": "TestPlayer2", "value": 7}]
+        assert "interrupts" in CustomHandlerAnalysis.ANALYSIS_HANDLERS
+
+    def test_execute_analysis_reuses_filtered_players_per_role_set(self, mock_api_client, sample_players_data):
+        """Test that analyses with the same roles share one filtered player list."""
+
+        class PlayersAnalysis(ConfigurationBasedAnalysis):
+            ANALYSIS_HANDLERS = {**BossAnalysisBase.ANALYSIS_HANDLERS, "players": "_handle_players"}
+
+            def _handle_players(self, report_code, config, fight_ids, players):
+                return players
+
+        analysis = PlayersAnalysis(mock_api_client)
+        players_by_roles = {}
+
+        with patch.object(analysis, "_filter_players_by_roles", wraps=analysis._filter_players_by_roles) as mock_filter:
+            first = analysis._execute_analysis(
+                "test_report",
+                {"type": "players", "roles": ["tank", "healer"]},
+                [1],
+                sample_players_data,
+                players_by_roles,
+            )
+            second = analysis._execute_analysis(
+                "test_report",
+                {"type": "players", "roles": ["healer", "tank"]},
+                [1],
+                sample_players_data,
+                players_by_roles,
+            )
+
+        assert first is second
+        assert [player["name"] for player in first] == ["TestPlayer1", "TestPlayer2"]
+        mock_filter.assert_called_once()
+
     @patch.object(ConfigurationBasedAnalysis, "find_analysis_data")
     def test_generate_single_plot_hit_count(self, mock_find_data, mock_api_client):
         """Test HitCountPlot generation with basic validation."""
@@ -412,6 +1268,81 @@ class TestConfigurationBasedAnalysis:
             assert "Unknown plot type" not in str(e)
             # Any other exception might be due to mocking limitations, which is acceptable for this test
 
+    @patch.object(ConfigurationBasedAnalysis, "_generate_single_plot")
+    def test_generate_plots_generic_uses_two_newest_reports(self, mock_generate_single_plot, mock_api_client):
+        """Test that plots compare the newest report against the one before it."""
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+        analysis.results = [
+            {"starttime": 1640995200.0, "total_duration": 100, "analysis": []},
+            {"starttime": 1641600000.0, "total_duration": 300, "analysis": []},
+            {"starttime": 1641081600.0, "total_duration": 200, "analysis": []},
+        ]
+
+        analysis._generate_plots_generic()
+
+        _, report_date, current_duration, previous_duration = mock_generate_single_plot.call_args[0]
+        assert report_date == datetime.fromtimestamp(1641600000.0).strftime("%d.%m.%Y")
+        assert (current_duration, previous_duration) == (300, 200)
+
+    @pytest.mark.parametrize("max_concurrent_plots", [1, 2])
+    def test_generate_plots_generic_saves_collected_plots(self, max_concurrent_plots, mock_api_client, tmp_path):
+        """Test that plots are built first and then saved, in worker processes if allowed, with failures logged."""
+
+        class CustomPlotAnalysis(RecordingPlotAnalysis):
+            CONFIG = [
+                {"name": "Test", "plot": {"title": title, "type": "RecordingPlot", "column_key_1": "test"}}
+                for title in ("Broken", "Working")
+            ]
+
+        analysis = CustomPlotAnalysis(mock_api_client)
+        analysis.results = [
+            {
+                "analysis": [{"name": "Test", "data": [{"player_name": "TestPlayer", "test": 100}]}],
+                "starttime": 1640995200.0,
+            }
+        ]
+
+        env = {"MAX_CONCURRENT_PLOTS": str(max_concurrent_plots), "OUTPUT_DIRECTORY": str(tmp_path)}
+        # Allow a second worker process even on single-core machines
+        with patch.dict(os.environ, env), patch("src.guild_log_analysis.analysis.base.os.cpu_count", return_value=2):
+            with patch(
+                "src.guild_log_analysis.analysis.base.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+            ) as mock_pool:
+                with patch("src.guild_log_analysis.analysis.base.logger") as mock_logger:
+                    analysis._generate_plots_generic()
+
+        assert mock_pool.called is (max_concurrent_plots > 1)
+        assert [path.name for path in tmp_path.iterdir()] == ["Working.txt"]
+        mock_logger.error.assert_called_once_with("Error generating plot Broken: render failed")
+
+    @patch.object(ConfigurationBasedAnalysis, "_generate_single_plot")
+    def test_generate_plots_generic_reuses_plot_factories(self, mock_generate_single_plot, mock_api_client):
+        """Test that plot configurations and factories are built once per CONFIG entry."""
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+        analysis.results = [{"starttime": 1640995200.0, "total_duration": 100, "analysis": []}]
+
+        with patch.object(analysis, "_build_plot_factory", wraps=analysis._build_plot_factory) as mock_build:
+            analysis._generate_plots_generic()
+            analysis._generate_plots_generic()
+
+        assert mock_build.call_count == len(analysis.CONFIG)
+        factories = [call.kwargs["plot_factory"] for call in mock_generate_single_plot.call_args_list]
+        assert factories[: len(analysis.CONFIG)] == factories[len(analysis.CONFIG) :]
+        assert factories[0].keywords["title"] == analysis.CONFIG[0]["plot"]["title"]
+
+    def test_get_plot_metadata_refreshes_when_results_change(self, mock_api_client):
+        """Test that plot metadata is reused for the same results and recomputed for new reports."""
+        analysis = ConfigurationBasedAnalysis(mock_api_client)
+        analysis.results = [{"starttime": 1640995200.0, "total_duration": 100, "analysis": []}]
+
+        assert analysis._get_plot_metadata() is analysis._get_plot_metadata()
+
+        analysis.results.append({"starttime": 1641600000.0, "total_duration": 300, "analysis": []})
+
+        report_date, current_duration, previous_duration = analysis._get_plot_metadata()
+        assert report_date == datetime.fromtimestamp(1641600000.0).strftime("%d.%m.%Y")
+        assert (current_duration, previous_duration) == (300, 100)
+
     @patch.object(ConfigurationBasedAnalysis, "_generate_plots_generic")
     def test_generate_plots_uses_generic_method(self, mock_generate_generic, mock_api_client):
         """Test that generate_plots uses generic method when PLOT_CONFIG exists."""
@@ -470,3 +1401,40 @@ class TestConfigurationBasedAnalysis:
 
         with pytest.raises(ValueError, match="Unknown plot type: UnknownPlot"):
             analysis._generate_single_plot(plot_config, "2023-01-01", 300000, 250000)
+
+    def test_generate_single_plot_uses_subclass_plot_type(self, mock_api_client, created_plots):
+        """Test that subclasses can register custom plot types."""
+        analysis = RecordingPlotAnalysis(mock_api_client)
+        analysis.results = [
+            {
+                "analysis": [{"name": "Test", "data": [{"player_name": "TestPlayer", "test": 100}]}],
+                "starttime": 1640995200.0,
+            }
+        ]
+        plot_config = {"analysis_name": "Test", "type": "RecordingPlot", "title": "Test", "column_key_1": "test"}
+
+        analysis._generate_single_plot(plot_config, "2023-01-01", 300000, 250000)
+
+        assert len(created_plots) == 1
+        assert created_plots[0].kwargs["title"] == "Test"
+        assert created_plots[0].kwargs["column_key_1"] == "test"
+        assert "NumberPlot" in RecordingPlotAnalysis.PLOT_TYPES
+
+    def test_generate_single_plot_shares_data_cache(self, mock_api_client, created_plots):
+        """Test that plots of the same analysis reuse its data and DataFrame."""
+        analysis = RecordingPlotAnalysis(mock_api_client)
+        analysis.results = [
+            {
+                "analysis": [{"name": "Test", "data": [{"player_name": "TestPlayer", "test": 100}]}],
+                "starttime": 1640995200.0,
+            }
+        ]
+        plot_config = {"analysis_name": "Test", "type": "RecordingPlot", "title": "Test", "column_key_1": "test"}
+        data_cache = {}
+
+        with patch.object(analysis, "find_analysis_data", wraps=analysis.find_analysis_data) as mock_find_data:
+            analysis._generate_single_plot(plot_config, "2023-01-01", 300000, 250000, data_cache=data_cache)
+            analysis._generate_single_plot(plot_config, "2023-01-01", 300000, 250000, data_cache=data_cache)
+
+        mock_find_data.assert_called_once()
+        assert created_plots[0].kwargs["df"] is created_plots[1].kwargs["df"]
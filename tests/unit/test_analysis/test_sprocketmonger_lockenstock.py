@@ -0,0 +1,130 @@
+"""Test Sprocketmonger Lockenstock event-based analyses."""
+
+import numpy as np
+import pytest
+
+from src.guild_log_analysis.analysis.bosses.sprocketmonger_lockenstock import SprocketmongerLockenstockAnalysis
+
+
+def _wrong_mine_events_response(debuff_events, damage_events):
+    """Wrap debuff and damage events in the aliased wrong mine events response format."""
+    report = {
+        "debuffEvents": {"data": debuff_events, "nextPageTimestamp": None},
+        "damageEvents": {"data": damage_events, "nextPageTimestamp": None},
+    }
+    return {"data": {"reportData": {"report": report}}}
+
+
+class TestSprocketmongerLockenstockAnalysis:
+    """Test suite for SprocketmongerLockenstockAnalysis."""
+
+    @pytest.fixture
+    def analysis(self, mock_api_client):
+        """Create SprocketmongerLockenstockAnalysis instance for testing."""
+        return SprocketmongerLockenstockAnalysis(mock_api_client)
+
+    @pytest.fixture
+    def wrong_mine_config(self):
+        """Wrong mine analysis configuration."""
+        return {
+            "debuff_ability_id": 1218342,
+            "damage_ability_id": 1219047,
+            "correlation_window_ms": 1000,
+            "min_victims_threshold": 2,
+        }
+
+    def test_wrong_mine_triggers_correlate_damage_within_window(
+        self, analysis, mock_api_client, sample_players_data, wrong_mine_config
+    ):
+        """Test that only damage in the same fight and time window counts as victims."""
+        debuff_events = [
+            {"type": "applydebuff", "timestamp": 1000, "targetID": 1, "fight": 1},
+            {"type": "applydebuff", "timestamp": 5000, "targetID": 2, "fight": 1},
+            {"type": "removedebuff", "timestamp": 1500, "targetID": 1, "fight": 1},
+        ]
+        damage_events = [
+            {"type": "damage", "timestamp": 1500, "targetID": 2, "fight": 1},
+            {"type": "damage", "timestamp": 2000, "targetID": 3, "fight": 1},
+            {"type": "damage", "timestamp": 2001, "targetID": 1, "fight": 1},
+            {"type": "damage", "timestamp": 5200, "targetID": 1, "fight": 2},
+            {"type": "damage", "timestamp": 5300, "targetID": 3, "fight": 2},
+            {"type": "absorbed", "timestamp": 5400, "targetID": 1, "fight": 1},
+            {"type": "damage", "timestamp": 5500, "targetID": 3, "fight": 1},
+        ]
+
+        mock_api_client.make_request.return_value = _wrong_mine_events_response(debuff_events, damage_events)
+
+        result = analysis.analyze_wrong_mine_triggers("test_report", [1, 2], sample_players_data, wrong_mine_config)
+
+        triggers = {row["player_name"]: row["wrong_mine_triggers"] for row in result}
+        assert triggers == {"TestPlayer1": 1, "TestPlayer2": 0, "TestPlayer3": 0}
+        mock_api_client.make_request.assert_called_once()
+        variables = mock_api_client.make_request.call_args[0][1]
+        assert (variables["debuffAbilityID"], variables["damageAbilityID"]) == (1218342.0, 1219047.0)
+
+    def test_partition_damage_events_by_fight(self):
+        """Test that damage events are split per fight in timestamp order without other event types."""
+        damage_events = [
+            {"type": "damage", "timestamp": 300, "targetID": 3, "fight": 2},
+            {"type": "absorbed", "timestamp": 200, "targetID": 2, "fight": 1},
+            {"type": "damage", "timestamp": 150, "targetID": 4, "fight": 1},
+            {"type": "damage", "timestamp": 100, "targetID": 1, "fight": 1},
+        ]
+
+        partitions = SprocketmongerLockenstockAnalysis._partition_damage_events(damage_events)
+
+        assert {fight_id: (ts.tolist(), ids.tolist()) for fight_id, (ts, ids) in partitions.items()} == {
+            1: ([100, 150], [1, 4]),
+            2: ([300], [3]),
+        }
+        timestamps, targets = partitions[1]
+        assert timestamps.dtype == targets.dtype == np.int32
+
+    def test_count_grouped_hits_merges_hits_within_window_per_fight(self):
+        """Test that hits within the grouping window count once per target and fight."""
+        damage_events = [
+            {"type": "damage", "timestamp": 20000, "targetID": 1, "fight": 1},
+            {"type": "damage", "timestamp": 25000, "targetID": 1, "fight": 1},
+            {"type": "damage", "timestamp": 21000, "targetID": 2, "fight": 1},
+            {"type": "damage", "timestamp": 30001, "targetID": 1, "fight": 1},
+            {"type": "damage", "timestamp": 26000, "targetID": 1, "fight": 2},
+            {"type": "absorbed", "timestamp": 50000, "targetID": 2, "fight": 1},
+        ]
+
+        hit_counts = SprocketmongerLockenstockAnalysis._count_grouped_hits(damage_events, 10000)
+
+        assert hit_counts == {1: 3, 2: 1}
+
+    def test_damage_helpers_handle_no_damage_events(self):
+        """Test that reports without damage events yield empty partitions and hit counts."""
+        absorbed_only = [{"type": "absorbed", "timestamp": 100, "targetID": 1, "fight": 1}]
+
+        assert SprocketmongerLockenstockAnalysis._partition_damage_events(absorbed_only) == {}
+        assert SprocketmongerLockenstockAnalysis._count_grouped_hits([], 10000) == {}
+
+    def test_wrong_mine_triggers_ignore_damage_without_applications(
+        self, analysis, mock_api_client, sample_players_data, wrong_mine_config
+    ):
+        """Test that damage events are not correlated when no debuff was applied."""
+        debuff_events = [{"type": "removedebuff", "timestamp": 1500, "targetID": 1, "fight": 1}]
+        damage_events = [
+            {"type": "damage", "timestamp": 1600, "targetID": target_id, "fight": 1} for target_id in (2, 3)
+        ]
+        mock_api_client.make_request.return_value = _wrong_mine_events_response(debuff_events, damage_events)
+
+        result = analysis.analyze_wrong_mine_triggers("test_report", [1, 2], sample_players_data, wrong_mine_config)
+
+        assert mock_api_client.make_request.call_count == 1
+        assert "GetWrongMineEvents" in mock_api_client.make_request.call_args[0][0]
+        assert [row["wrong_mine_triggers"] for row in result] == [0, 0, 0]
+
+    def test_wrong_mine_triggers_record_failed_request(
+        self, analysis, mock_api_client, sample_players_data, wrong_mine_config
+    ):
+        """Test that a failed events request is recorded so the empty result is not persisted."""
+        mock_api_client.make_request.side_effect = RuntimeError("connection reset")
+
+        result = analysis.analyze_wrong_mine_triggers("test_report", [1, 2], sample_players_data, wrong_mine_config)
+
+        assert result == []
+        assert "test_report" in analysis._failed_reports
@@ -111,6 +111,29 @@ class TestCacheManager:
         # Should now return the cached response
         assert cache_manager.get(query, variables) == response
 
+    def test_concurrent_set_keeps_all_entries(self):
+        """Test that concurrent writers do not lose cache entries."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache_manager = CacheManager(self.test_cache_file)
+
+        with patch.object(cache_manager, "_save_cache"):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda i: cache_manager.set(f"query {i}", None, {"data": i}), range(100)))
+
+        assert all(cache_manager.get(f"query {i}") == {"data": i} for i in range(100))
+
+    def test_cache_file_roundtrip_without_orjson(self):
+        """Test that the cache file is written and read with the standard json fallback."""
+        self.test_cache_files_to_cleanup.append(self.test_cache_file)
+
+        with patch("src.guild_log_analysis.api.client.orjson", None):
+            cache_manager = CacheManager(self.test_cache_file)
+            cache_manager.set("test query", None, {"data": "Kâsandra"})
+            reloaded = CacheManager(self.test_cache_file)
+
+        assert reloaded.get("test query") == {"data": "Kâsandra"}
+
     def test_cache_file_operations_integration(self):
         """Integration test for actual cache file operations with cleanup."""
         import json
@@ -219,6 +242,14 @@ class TestWarcraftLogsAPIClient:
         client = WarcraftLogsAPIClient()
         assert client.access_token is None
 
+    def test_session_pool_sized_for_concurrency(self):
+        """Test that the session keeps enough pooled connections for concurrent requests."""
+        with patch.dict("os.environ", {"MAX_CONCURRENT_REQUESTS": "6"}):
+            client = WarcraftLogsAPIClient(access_token="test_token")
+
+        adapter = client.session.get_adapter("https://www.warcraftlogs.com/api/v2/client")
+        assert adapter._pool_maxsize == 36
+
     def test_update_auth_header(self):
         """Test authorization header update."""
         token = "test_token"
@@ -251,7 +282,7 @@ class TestWarcraftLogsAPIClient:
         with patch.object(client.session, "post") as mock_post:
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"data": "test"}
+            mock_response.content = b'{"data": "test"}'
             mock_post.return_value = mock_response
 
             query = "query { test }"
@@ -277,10 +308,7 @@ class TestWarcraftLogsAPIClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "errors": [{"message": "Test error"}],
-            "data": None,
-        }
+        mock_response.content = b'{"errors": [{"message": "Test error"}], "data": null}'
         mock_post.return_value = mock_response
 
         query = "query { test }"
@@ -290,6 +318,19 @@ class TestWarcraftLogsAPIClient:
 
         assert "GraphQL errors" in str(exc_info.value)
 
+    @patch("requests.Session.post")
+    def test_make_request_invalid_json_body(self, mock_post):
+        """Test that a successful response with a body that is not JSON raises APIError."""
+        client = WarcraftLogsAPIClient(access_token="test_token")
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>Bad Gateway</html>"
+        mock_post.return_value = mock_response
+
+        with pytest.raises(APIError):
+            client.make_request("query { invalidBody }")
+
     @patch("requests.Session.post")
     def test_make_request_unauthorized(self, mock_post):
         """Test API request with unauthorized response."""
@@ -372,7 +413,7 @@ class TestWarcraftLogsAPIClient:
 
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "fresh"}
+        mock_response.content = b'{"data": "fresh"}'
         mock_post.return_value = mock_response
 
         query = "query { test }"
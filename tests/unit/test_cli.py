@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from src.guild_log_analysis._version import __version__
 from src.guild_log_analysis.cli import (
     create_parser,
     list_available_bosses,
@@ -49,6 +50,23 @@ class TestArgumentParser:
         args = parser.parse_args(["--list-bosses"])
         assert args.list_bosses is True
 
+    def test_parser_invalidate_cache_flag(self):
+        """Test that cached report results are only invalidated on request."""
+        parser = create_parser()
+        base_args = ["--reports", "test1", "--boss", "one_armed_bandit"]
+        assert parser.parse_args(base_args).invalidate_cache is False
+        assert parser.parse_args(base_args + ["--invalidate-cache"]).invalidate_cache is True
+
+    def test_parser_version_flag(self, capsys):
+        """Test that the version flag prints the version and exits."""
+        parser = create_parser()
+
+        with pytest.raises(SystemExit) as exc_info:
+            parser.parse_args(["--version"])
+
+        assert exc_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
+
     def test_parser_verbose_debug_flags(self):
         """Test verbose and debug flags."""
         parser = create_parser()
@@ -92,6 +92,66 @@ IGNORED_PLAYERS=IgnoredPlayer1,IgnoredPlayer2
             settings = Settings()
             assert settings.redirect_uri == "http://example.com/callback"
 
+    def test_max_concurrent_requests_default(self):
+        """Test max concurrent requests uses default when not set."""
+        with patch.dict(os.environ, {"CLIENT_ID": "test_id"}, clear=True):
+            settings = Settings()
+            assert settings.max_concurrent_requests == 4
+
+    def test_max_concurrent_requests_is_at_least_one(self):
+        """Test max concurrent requests is clamped to one worker."""
+        with patch.dict(os.environ, {"MAX_CONCURRENT_REQUESTS": "0"}, clear=False):
+            settings = Settings()
+            assert settings.max_concurrent_requests == 1
+
+    def test_max_concurrent_plots_default(self):
+        """Test max concurrent plots uses default when not set."""
+        with patch.dict(os.environ, {"CLIENT_ID": "test_id"}, clear=True):
+            settings = Settings()
+            assert settings.max_concurrent_plots == 4
+
+    def test_max_concurrent_plots_is_at_least_one(self):
+        """Test max concurrent plots is clamped to one worker."""
+        with patch.dict(os.environ, {"MAX_CONCURRENT_PLOTS": "-2"}, clear=False):
+            settings = Settings()
+            assert settings.max_concurrent_plots == 1
+
+    def test_report_cache_disabled_default(self):
+        """Test report cache is disabled when not set."""
+        with patch.dict(os.environ, {"CLIENT_ID": "test_id"}, clear=True):
+            settings = Settings()
+            assert settings.report_cache_enabled is False
+
+    def test_report_cache_can_be_enabled(self):
+        """Test report cache can be enabled through the environment."""
+        with patch.dict(os.environ, {"REPORT_CACHE_ENABLED": "True"}, clear=False):
+            settings = Settings()
+            assert settings.report_cache_enabled is True
+
+    def test_report_cache_can_be_disabled(self):
+        """Test report cache can be disabled through the environment."""
+        with patch.dict(os.environ, {"REPORT_CACHE_ENABLED": "False"}, clear=False):
+            settings = Settings()
+            assert settings.report_cache_enabled is False
+
+    def test_report_cache_empty_value_disables(self):
+        """Test an empty report cache setting keeps the cache disabled."""
+        with patch.dict(os.environ, {"REPORT_CACHE_ENABLED": ""}, clear=False):
+            settings = Settings()
+            assert settings.report_cache_enabled is False
+
+    def test_report_cache_refresh_default(self):
+        """Test cached report results are loaded unless a refresh is requested."""
+        with patch.dict(os.environ, {"CLIENT_ID": "test_id"}, clear=True):
+            settings = Settings()
+            assert settings.report_cache_refresh is False
+
+    def test_report_cache_refresh_enabled(self):
+        """Test report cache refresh can be requested through the environment."""
+        with patch.dict(os.environ, {"REPORT_CACHE_REFRESH": "yes"}, clear=False):
+            settings = Settings()
+            assert settings.report_cache_refresh is True
+
     def test_cache_directory_default(self):
         """Test cache directory uses default when not set."""
         with patch.dict(os.environ, {"CLIENT_ID": "test_id"}, clear=True):
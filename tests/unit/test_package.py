@@ -0,0 +1,113 @@
+"""Tests for the top-level package namespace."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import src.guild_log_analysis as package
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+
+def _run_in_fresh_interpreter(code: str) -> str:
+    """
+    Run code in a fresh interpreter with the source directory on the path.
+
+    :param code: Python source to execute
+    :returns: Stripped standard output of the interpreter
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path.insert(0, {str(SRC_DIR)!r}); {code}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyNamespace:
+    """Test cases for lazy resolution of public package attributes."""
+
+    def test_import_does_not_load_analysis_stack(self):
+        """Test that importing the package does not import the analysis stack."""
+        output = _run_in_fresh_interpreter(
+            "import guild_log_analysis; "
+            "print('guild_log_analysis.analysis.base' in sys.modules, 'requests' in sys.modules)"
+        )
+
+        assert output == "False False"
+
+    def test_lazy_attributes_resolve(self):
+        """Test that public attributes resolve to the real classes."""
+        from src.guild_log_analysis.analysis.base import BossAnalysisBase
+        from src.guild_log_analysis.api.client import WarcraftLogsAPIClient
+
+        assert package.BossAnalysisBase is BossAnalysisBase
+        assert package.WarcraftLogsAPIClient is WarcraftLogsAPIClient
+        assert "BossAnalysisBase" in vars(package)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            package.DoesNotExist
+
+    def test_dir_lists_lazy_attributes(self):
+        """Test that dir() includes lazily exported names."""
+        assert set(package.__all__) <= set(dir(package))
+
+    def test_export_tables_are_immutable(self):
+        """Test that the export list and lazy mapping cannot be mutated."""
+        assert isinstance(package.__all__, tuple)
+        assert set(package._LAZY) == set(package.__all__)
+
+        with pytest.raises(TypeError):
+            package._LAZY["Injected"] = (".api.client", "WarcraftLogsAPIClient")
+
+    def test_boss_import_does_not_load_siblings(self):
+        """Test that importing one boss module does not import the other bosses."""
+        output = _run_in_fresh_interpreter(
+            "import guild_log_analysis.analysis.bosses.one_armed_bandit; "
+            "print('guild_log_analysis.analysis.bosses.sprocketmonger_lockenstock' in sys.modules)"
+        )
+
+        assert output == "False"
+
+    def test_analysis_package_exports_resolve(self):
+        """Test that the analysis package resolves its exports lazily."""
+        from src.guild_log_analysis import analysis
+        from src.guild_log_analysis.analysis.bosses.one_armed_bandit import OneArmedBanditAnalysis
+
+        assert analysis.OneArmedBanditAnalysis is OneArmedBanditAnalysis
+        with pytest.raises(AttributeError):
+            analysis.DoesNotExist
+
+
+class TestLazyExports:
+    """Test cases for the lazy_exports namespace factory."""
+
+    def test_resolved_attribute_is_cached_in_namespace(self):
+        """Test that a resolved attribute is stored in the namespace."""
+        from src.guild_log_analysis._lazy import lazy_exports
+
+        namespace = {"__name__": "src.guild_log_analysis"}
+        getattr_, _ = lazy_exports(namespace, {"Settings": (".config.settings", "Settings")})
+
+        value = getattr_("Settings")
+
+        assert namespace["Settings"] is value
+
+    def test_unknown_attribute_does_not_import(self):
+        """Test that unknown names are rejected without an import attempt."""
+        from src.guild_log_analysis._lazy import lazy_exports
+
+        namespace = {"__name__": "src.guild_log_analysis"}
+        getattr_, _ = lazy_exports(namespace, {})
+
+        with patch("importlib.import_module") as mock_import:
+            with pytest.raises(AttributeError):
+                getattr_("Typo")
+
+        mock_import.assert_not_called()